@@ -1701,7 +1701,9 @@ def dedupe(settings=None):
     # Step 1: Noise filtering and domain validation
     data_quality_cfg = settings.get("data_quality", {}) if settings else {}
     cleaner = DataCleaner(config=data_quality_cfg.get("noise_filter"))
-    cleaned_leads, rejected_noise = cleaner.clean_dataset(leads)
+    cleaned_df, rejected_df = cleaner.clean_dataframe(df)
+    cleaned_leads = cleaned_df.to_dict(orient="records")
+    rejected_noise = rejected_df.to_dict(orient="records")
     
     cleaning_stats = cleaner.get_stats(len(leads), cleaned_leads, rejected_noise)
     logger.info(f"Noise Filter: {cleaning_stats['cleaned_count']} kept, "
@@ -1801,7 +1803,7 @@ def brave_discovery(settings=None):
     # Import Brave client
     from src.processors.brave_integration import BraveSearchClient
     
-    brave_client = BraveSearchClient()
+    brave_client = BraveSearchClient(settings=brave_cfg)
     
     if not brave_client.api_key:
         logger.error("Brave API key not configured. Set Brave_API_KEY or BRAVE_API_KEY env variable.")
@@ -1813,8 +1815,14 @@ def brave_discovery(settings=None):
     
     logger.info(f"Processing {len(leads)} leads for Brave discovery")
     
+    # Combined mode: one query per lead covers both discovery and evidence
+    if brave_cfg.get("combined_search", False):
+        logger.info("=== Phase 2: Combined Website + SCE Evidence Search ===")
+        max_leads = brave_cfg.get("evidence_search", {}).get("max_leads_per_run", 200)
+        leads = brave_client.batch_combined(leads[:max_leads]) + leads[max_leads:]
+    
     # Phase 2A: Website Discovery
-    if brave_cfg.get("website_discovery", {}).get("enabled", True):
+    elif brave_cfg.get("website_discovery", {}).get("enabled", True):
         logger.info("=== Phase 2A: Website Discovery ===")
         
         # Filter leads needing discovery
@@ -1844,7 +1852,7 @@ def brave_discovery(settings=None):
                         break
     
     # Phase 2B: Evidence Search
-    if brave_cfg.get("evidence_search", {}).get("enabled", True):
+    if not brave_cfg.get("combined_search", False) and brave_cfg.get("evidence_search", {}).get("enabled", True):
         logger.info("=== Phase 2B: SCE Evidence Search ===")
         
         batch_size = brave_cfg.get("evidence_search", {}).get("batch_size", 50)
@@ -17,7 +17,7 @@ from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 import asyncio
 try:
-    from src.probers.playwright_probe import probe_page
+    from src.probers.playwright_probe import probe_page, iter_api_log
 except ImportError:
     probe_page = None
 
@@ -449,8 +449,7 @@ class AutoDiscover:
                      return exhibitors
 
             # 2. Analyze captured API logs (Network Sniffing)
-            api_data = result.get("api_data", [])
-            for entry in api_data:
+            for entry in iter_api_log(result.get("api_log_path")):
                 data = entry.get("data")
                 extracted = self._extract_from_json(data)
                 if extracted:
@@ -9,8 +9,7 @@ from playwright.async_api import async_playwright
 from typing import Dict, List, Optional
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the caller (see __main__ below for standalone runs)
 logger = logging.getLogger(__name__)
 
 def _safe_int(val, default=0):
@@ -54,13 +53,46 @@ async def capture_json(response, storage, max_payload_kb: int = 512):
     except Exception:
         pass
 
-async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
+def iter_api_log(path: Optional[str]):
+    """
+    Yield captured API entries from a probe's ``api_log_path`` file.
+
+    The log is a single JSON array, so the file is loaded in full before
+    the first entry is yielded.
+    """
+    if not path or not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for entry in json.load(f):
+            yield entry
+
+
+async def _capture_worker(queue: asyncio.Queue, storage):
+    """Drain captured responses from the queue into storage."""
+    while True:
+        response = await queue.get()
+        try:
+            await capture_json(response, storage)
+        finally:
+            queue.task_done()
+
+
+async def _enqueue_response(queue: asyncio.Queue, response) -> None:
+    """Response handler: queue for capture, waiting for room when the queue is full."""
+    await queue.put(response)
+
+
+async def probe_page(url: str, output_dir: str = "data/probe", include_api_data: bool = False) -> Dict:
     """
     Probes a URL using Playwright to capture dynamic content, hidden APIs, and screenshots.
     
     Args:
         url: The target URL to probe.
         output_dir: Directory to save screenshots and JSON logs.
+        include_api_data: Also return the captured API payloads in-memory.
+            By default only ``api_log_path`` is returned, so the payloads
+            are not kept in the result dict; load them on demand with
+            ``iter_api_log`` (which reads the whole file at once).
         
     Returns:
         Dictionary containing extracted content, screenshot path, and captured API data.
@@ -85,16 +117,30 @@ async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
         # Use a realistic user agent to avoid basic bot detection
         url_hash = hashlib.md5(url.encode()).hexdigest()
         har_path = str(domain_dir / f"{url_hash}.har")
+        # HAR defaults keep files small; set PROBE_HAR_MODE=full (and
+        # PROBE_HAR_CONTENT=embed) to record everything when debugging.
         har_content = os.environ.get("PROBE_HAR_CONTENT", "omit")
+        har_mode = os.environ.get("PROBE_HAR_MODE", "minimal")
         context = await browser.new_context(
             record_har_path=har_path,
             record_har_content=har_content,
+            record_har_mode=har_mode,
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
         page = await context.new_page()
 
-        # Hook into network responses
-        page.on("response", lambda res: asyncio.create_task(capture_json(res, network_data)))
+        # Hook into network responses (bounded queue + fixed worker pool)
+        response_queue: asyncio.Queue = asyncio.Queue(maxsize=512)
+        workers = [
+            asyncio.create_task(_capture_worker(response_queue, network_data))
+            for _ in range(4)
+        ]
+
+        async def on_response(res):
+            # Async handler: a full queue delays the handler, nothing is dropped
+            await _enqueue_response(response_queue, res)
+
+        page.on("response", on_response)
         page.on("console", lambda msg: console_logs.append({
             "type": msg.type,
             "text": msg.text,
@@ -102,7 +148,7 @@ async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
         }))
 
         try:
-            logger.info(f"Probing URL: {url}")
+            logger.info("Probing URL: %s", url)
             await page.goto(url, timeout=45000, wait_until="domcontentloaded")
             
             # Wait for dynamic content to load (heuristic wait)
@@ -115,7 +161,7 @@ async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
             # Capture Screenshot (Evidence)
             screenshot_path = str(domain_dir / f"{url_hash}.png")
             await page.screenshot(path=screenshot_path, full_page=True)
-            logger.info(f"Screenshot saved to: {screenshot_path}")
+            logger.info("Screenshot saved to: %s", screenshot_path)
 
             # Capture DOM Content
             page_content = await page.content()
@@ -124,10 +170,17 @@ async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
                 f.write(page_content)
             
         except Exception as e:
-            logger.error(f"Error probing {url}: {str(e)}")
+            logger.error("Error probing %s: %s", url, e)
             page_content = ""
             screenshot_path = None
         finally:
+            # Drain pending captures while the context can still serve bodies
+            try:
+                await asyncio.wait_for(response_queue.join(), timeout=15)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out draining %d queued responses", response_queue.qsize())
+            for worker in workers:
+                worker.cancel()
             try:
                 await context.close()
             except Exception:
@@ -139,7 +192,7 @@ async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
             json_log_path = str(domain_dir / f"{url_hash}_api.json")
             with open(json_log_path, "w", encoding='utf-8') as f:
                 json.dump(network_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Captured {len(network_data)} JSON responses to: {json_log_path}")
+            logger.info("Captured %d JSON responses to: %s", len(network_data), json_log_path)
         else:
             json_log_path = None
 
@@ -159,11 +212,12 @@ async def probe_page(url: str, output_dir: str = "data/probe") -> Dict:
             "har_path": har_path if har_path and os.path.exists(har_path) else None,
             "console_log_path": console_log_path,
             "api_responses_count": len(network_data),
-            "api_data": network_data,
+            "api_data": network_data if include_api_data else None,
             "api_log_path": json_log_path
         }
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Simple test execution
     test_url = "https://www.brueckner-textile.com/en/news/"
     # Run the async loop
@@ -3,51 +3,159 @@ Brave Search Integration - Phase 2: Pipeline Enhancement
 Handles website discovery and Stenter Customer Evidence (SCE) search
 """
 
+import asyncio
+import copy
 import os
+import re
 import requests
-from typing import List, Dict, Optional
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 from time import sleep, time
 import logging
 
+try:
+    import aiohttp
+except ImportError:  # async batch path is optional
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
 
 class BraveSearchClient:
     """
     Wrapper for Brave Search API
-    Rate limit: 15 calls/min (1 call per 4 seconds)
+    Rate limit: 15 calls/min (token bucket, bursts up to 15 calls)
     """
     
     BASE_URL = "https://api.search.brave.com/res/v1/web/search"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Retries for 5xx responses (exponential backoff, capped at 60s)
+    MAX_RETRIES = 2
+    
+    # Upper bound on cached (query, count) entries
+    CACHE_MAX_ENTRIES = 10_000
+    
+    # Domain filters - never treat these as a company's own website
+    INVALID_DOMAINS = frozenset({
+        'linkedin.com', 'facebook.com', 'instagram.com', 
+        'wikipedia.org', 'indiamart.com', 'alibaba.com',
+        'made-in-china.com', 'tradekey.com', 'youtube.com',
+        'twitter.com', 'x.com'
+    })
+    _INVALID_SUFFIXES = tuple('.' + d for d in INVALID_DOMAINS)
+    
+    # Evidence queries: short high-signal query first, broader one only on a miss
+    _PRIMARY_Q = "stenter"
+    _FALLBACK_Q = '"stenter" OR "heat setting" OR "textile finishing"'
+    # Combined discovery + evidence query (one rate-limit slot per lead)
+    _COMBINED_Q = 'official website OR stenter OR "heat setting"'
+    
+    # Evidence keywords with confidence levels
+    STRONG_EVIDENCE = [
+        "installed stenter", "stenter machine", "stenter parts",
+        "heat setting equipment", "stenters installed",
+        "finishing line", "brückner stenter", "monforts stenter"
+    ]
+    MEDIUM_EVIDENCE = [
+        "textile finishing", "fabric processing", "dyeing and finishing",
+        "continuous processing", "heat treatment", "fabric treatment"
+    ]
+    # One compiled alternation per level: a single scan per result text. The
+    # lookahead reports every start position (overlapping terms included) so
+    # _first_keyword can pick the hit with the lowest list (priority) index.
+    _STRONG_RE = re.compile("(?=(%s))" % "|".join(re.escape(kw) for kw in STRONG_EVIDENCE))
+    _MEDIUM_RE = re.compile("(?=(%s))" % "|".join(re.escape(kw) for kw in MEDIUM_EVIDENCE))
+    _STRONG_RANK = {kw: i for i, kw in enumerate(STRONG_EVIDENCE)}
+    _MEDIUM_RANK = {kw: i for i, kw in enumerate(MEDIUM_EVIDENCE)}
+    
+    def __init__(self, api_key: Optional[str] = None, settings: Optional[Dict] = None):
         """
         Initialize Brave client
         
         Args:
             api_key: Brave API key (reads from env if not provided)
+            settings: Optional config dict (e.g. cache_ttl in seconds)
         """
+        self.cfg = settings or {}
         self.api_key = api_key or os.getenv('Brave_API_KEY') or os.getenv('BRAVE_API_KEY')
         if not self.api_key:
             logger.warning("No Brave API key found. Set Brave_API_KEY or BRAVE_API_KEY env variable.")
         
         self.calls_made = 0
-        self.rate_limit = 15  # calls per minute
-        self.last_call_time = 0
-        self.min_delay = 4.0  # seconds between calls (60/15 = 4)
+        self.rate_limit = int(self.cfg.get('rate_limit', 15))  # calls per minute
+        
+        # Token bucket: idle time accrues credit up to `burst` calls
+        self._capacity = float(self.cfg.get('burst', self.rate_limit))
+        self._refill_rate = self.rate_limit / 60.0  # tokens per second
+        self._tokens = self._capacity
+        self._last_refill = time()
+        self._alock = None  # asyncio.Lock, bound per batch in _async_session()
+        self._netloc_cache: Dict[str, str] = {}
+        
+        # Persistent session: keep-alive to api.search.brave.com across calls
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/json",
+            "X-Subscription-Token": self.api_key or ""
+        })
+        # Retries are handled in search() so they can honor Retry-After
+        # and the token bucket
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        
+        # In-memory result cache: (query, count) -> (stored_at, results)
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict]]]" = OrderedDict()
+        self._cache_ttl = float(self.cfg.get('cache_ttl', 3600))
     
-    def _rate_limit_check(self):
-        """Respect API rate limits with delays"""
-        # Calculate time since last call
-        elapsed = time() - self.last_call_time
+    def get_session(self) -> requests.Session:
+        """Return the underlying HTTP session (for custom adapters/proxies)"""
+        return self.session
+    
+    def _take_token(self) -> float:
+        """Consume one token bucket slot; return seconds to wait before calling"""
+        now = time()
+        elapsed = max(0.0, now - self._last_refill)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_rate)
+        self._last_refill = max(now, self._last_refill)
+        
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
         
-        # If less than min_delay, wait
-        if elapsed < self.min_delay:
-            wait_time = self.min_delay - elapsed
+        wait_time = (1 - self._tokens) / self._refill_rate
+        self._tokens = 0.0
+        self._last_refill += wait_time
+        return self._last_refill - now
+    
+    def _rate_limit_check(self):
+        """Respect API rate limits with a token bucket (allows short bursts)"""
+        wait_time = self._take_token()
+        if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
             sleep(wait_time)
-        
-        self.last_call_time = time()
+    
+    async def _arate_limit_check(self):
+        """Async token bucket acquire; serialized so tasks share one bucket"""
+        async with self._alock:
+            wait_time = self._take_token()
+            if wait_time > 0:
+                logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
+    
+    def _cache_get(self, cache_key: Tuple[str, int]) -> Optional[List[Dict]]:
+        cached = self._cache.get(cache_key)
+        if cached and time() - cached[0] < self._cache_ttl:
+            self._cache.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
+        return None
+    
+    def _cache_put(self, cache_key: Tuple[str, int], results: List[Dict]):
+        self._cache[cache_key] = (time(), copy.deepcopy(results))
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
     
     def search(self, query: str, count: int = 5) -> List[Dict]:
         """
@@ -64,33 +172,146 @@ class BraveSearchClient:
             logger.warning("No API key - skipping search")
             return []
         
+        cache_key = (query.strip().lower(), count)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"Brave cache hit: '{query}'")
+            return cached
+        
         self._rate_limit_check()
         
-        headers = {
-            "Accept": "application/json",
-            "X-Subscription-Token": self.api_key
+        params = {
+            "q": query,
+            "count": min(count, 20)
         }
         
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = self.session.get(self.BASE_URL, params=params, timeout=30)
+                self._throttle_from(response.status_code, response.headers)
+                response.raise_for_status()
+                
+                self.calls_made += 1
+                
+                data = response.json()
+                results = data.get('web', {}).get('results', [])
+                
+                logger.debug(f"Brave search: '{query}' returned {len(results)} results")
+                
+                self._cache_put(cache_key, results)
+                return results
+                
+            except requests.exceptions.HTTPError as e:
+                if self._should_retry(e.response.status_code, attempt):
+                    sleep(min(60, 2 ** attempt))
+                    self._rate_limit_check()
+                    continue
+                logger.error(f"Brave API error: {e}")
+                return []
+            except requests.exceptions.RequestException as e:
+                # Request never got a response: don't let it consume quota
+                self._refund_token()
+                logger.error(f"Brave API error: {e}")
+                return []
+        return []
+    
+    async def _asearch(self, session, query: str, count: int = 5) -> List[Dict]:
+        """Async variant of search() used by the batch methods"""
+        if not self.api_key:
+            logger.warning("No API key - skipping search")
+            return []
+        
+        cache_key = (query.strip().lower(), count)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"Brave cache hit: '{query}'")
+            return cached
+        
+        await self._arate_limit_check()
+        
         params = {
             "q": query,
             "count": min(count, 20)
         }
         
-        try:
-            response = requests.get(self.BASE_URL, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            
-            self.calls_made += 1
-            
-            data = response.json()
-            results = data.get('web', {}).get('results', [])
-            
-            logger.debug(f"Brave search: '{query}' returned {len(results)} results")
-            return results
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Brave API error: {e}")
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with session.get(self.BASE_URL, params=params) as response:
+                    self._throttle_from(response.status, response.headers)
+                    response.raise_for_status()
+                    data = await response.json()
+                break
+            except aiohttp.ClientResponseError as e:
+                if self._should_retry(e.status, attempt):
+                    await asyncio.sleep(min(60, 2 ** attempt))
+                    await self._arate_limit_check()
+                    continue
+                logger.error(f"Brave API error: {e}")
+                return []
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._refund_token()
+                logger.error(f"Brave API error: {e}")
+                return []
+        else:
             return []
+        
+        self.calls_made += 1
+        results = data.get('web', {}).get('results', [])
+        logger.debug(f"Brave search: '{query}' returned {len(results)} results")
+        
+        self._cache_put(cache_key, results)
+        return results
+    
+    def _should_retry(self, status: int, attempt: int) -> bool:
+        return status >= 500 and attempt < self.MAX_RETRIES
+    
+    def _throttle_from(self, status: int, headers) -> None:
+        """On 429/503, drain the bucket until the server's Retry-After passes"""
+        if status not in (429, 503):
+            return
+        retry_after = self._retry_after_seconds(headers.get("Retry-After"))
+        logger.warning(f"Brave API returned {status}; backing off {retry_after:.0f}s")
+        self._tokens = 0.0
+        self._last_refill = max(self._last_refill, time() + retry_after)
+    
+    @staticmethod
+    def _retry_after_seconds(value: Optional[str], default: float = 4.0) -> float:
+        """Parse Retry-After (delta-seconds or HTTP-date)"""
+        if not value:
+            return default
+        try:
+            return max(float(value), 0.0) or default
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time(), 0.0) or default
+        except (TypeError, ValueError):
+            return default
+    
+    def _refund_token(self) -> None:
+        self._tokens = min(self._capacity, self._tokens + 1)
+    
+    def _use_async(self) -> bool:
+        """Batch methods go async when aiohttp is available and no loop is running"""
+        if aiohttp is None or not self.cfg.get('async_batch', True):
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    def _async_session(self):
+        """Open an aiohttp session for one batch (and bind the bucket lock to its loop)"""
+        self._alock = asyncio.Lock()
+        return aiohttp.ClientSession(
+            headers={
+                "Accept": "application/json",
+                "X-Subscription-Token": self.api_key or ""
+            },
+            connector=aiohttp.TCPConnector(limit=8),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
     
     def discover_website(self, company_name: str, country: str = "") -> Optional[str]:
         """
@@ -108,25 +329,25 @@ class BraveSearchClient:
         Returns:
             URL or None
         """
-        # Build query
+        results = self.search(self._website_query(company_name, country), count=5)
+        return self._pick_website(results, company_name)
+    
+    async def _adiscover_website(self, session, company_name: str, country: str = "") -> Optional[str]:
+        results = await self._asearch(session, self._website_query(company_name, country), count=5)
+        return self._pick_website(results, company_name)
+    
+    def _website_query(self, company_name: str, country: str = "") -> str:
         country_str = f" {country}" if country else ""
-        query = f'"{company_name}"{country_str} official website'
-        
-        results = self.search(query, count=5)
-        
-        # Domain filters - exclude these
-        invalid_domains = [
-            'linkedin.com', 'facebook.com', 'instagram.com', 
-            'wikipedia.org', 'indiamart.com', 'alibaba.com',
-            'made-in-china.com', 'tradekey.com', 'youtube.com',
-            'twitter.com', 'x.com'
-        ]
-        
+        return f'"{company_name}"{country_str} official website'
+    
+    def _pick_website(self, results: List[Dict], company_name: str) -> Optional[str]:
+        """Return the first result that is not a social/directory domain"""
         for result in results:
             url = result.get('url', '')
             
-            # Skip invalid domains
-            if any(domain in url.lower() for domain in invalid_domains):
+            # Skip social media / directory domains (and their subdomains)
+            netloc = self._netloc(url)
+            if netloc in self.INVALID_DOMAINS or netloc.endswith(self._INVALID_SUFFIXES):
                 continue
             
             # Found valid website
@@ -141,7 +362,9 @@ class BraveSearchClient:
         """
         Search for Stenter Customer Evidence (SCE)
         
-        Query pattern: "{company} {country} stenter OR stenters OR textile finishing"
+        Query pattern: "{company} {country} stenter", falling back to
+        "{company} {country} "stenter" OR "heat setting" OR "textile finishing""
+        only when the first query yields no evidence
         
         Args:
             company_name: Company name
@@ -157,57 +380,54 @@ class BraveSearchClient:
                 'confidence': str  # 'strong', 'medium', 'weak'
             }
         """
-        # Machine keywords to search for
-        machine_keywords = [
-            "stenter", "stenters", "heat setting", 
-            "textile finishing", "fabric processing",
-            "finishing line", "continuous processing"
-        ]
-        
+        results = self.search(self._evidence_query(company_name, country, website, self._PRIMARY_Q), count=5)
+        evidence = self._scan_evidence(results)
+        if not evidence['has_evidence']:
+            results = self.search(self._evidence_query(company_name, country, website, self._FALLBACK_Q), count=10)
+            evidence = self._scan_evidence(results)
+        return evidence
+    
+    async def _afind_evidence(self, session, company_name: str, country: str = "",
+                              website: str = "") -> Dict:
+        results = await self._asearch(session, self._evidence_query(company_name, country, website, self._PRIMARY_Q), count=5)
+        evidence = self._scan_evidence(results)
+        if not evidence['has_evidence']:
+            results = await self._asearch(session, self._evidence_query(company_name, country, website, self._FALLBACK_Q), count=10)
+            evidence = self._scan_evidence(results)
+        return evidence
+    
+    def _evidence_query(self, company_name: str, country: str, website: str, terms: str) -> str:
         # Build query
         country_str = f" {country}" if country else ""
-        site_filter = f" site:{website.replace('http://', '').replace('https://', '').split('/')[0]}" if website else ""
-        
-        query = f'"{company_name}"{country_str}{site_filter} {" OR ".join(machine_keywords)}'
-        
-        results = self.search(query, count=10)
-        
-        # Evidence keywords with confidence levels
-        strong_evidence = [
-            "installed stenter", "stenter machine", "stenter parts",
-            "heat setting equipment", "stenters installed",
-            "finishing line", "brückner stenter", "monforts stenter"
-        ]
-        
-        medium_evidence = [
-            "textile finishing", "fabric processing", "dyeing and finishing",
-            "continuous processing", "heat treatment", "fabric treatment"
-        ]
+        site_filter = f" site:{self._netloc(website)}" if website else ""
         
+        return f'"{company_name}"{country_str}{site_filter} {terms}'
+    
+    def _netloc(self, url: str) -> str:
+        """Lowercased host without www. (memoized; accepts scheme-less URLs)"""
+        netloc = self._netloc_cache.get(url)
+        if netloc is None:
+            parsed = urlparse(url if '://' in url else 'https://' + url)
+            netloc = parsed.netloc.lower().removeprefix('www.')
+            self._netloc_cache[url] = netloc
+        return netloc
+    
+    def _scan_evidence(self, results: List[Dict]) -> Dict:
+        """Scan result titles/descriptions for strong, then medium SCE keywords"""
         # Check results for evidence
         for result in results:
             text = f"{result.get('title', '')} {result.get('description', '')}".lower()
             
-            # Check strong evidence
-            for evidence_kw in strong_evidence:
-                if evidence_kw in text:
+            for pattern, rank, confidence in ((self._STRONG_RE, self._STRONG_RANK, 'strong'),
+                                              (self._MEDIUM_RE, self._MEDIUM_RANK, 'medium')):
+                keyword = self._first_keyword(pattern, rank, text)
+                if keyword:
                     return {
                         'has_evidence': True,
-                        'evidence_type': evidence_kw,
+                        'evidence_type': keyword,
                         'evidence_url': result.get('url'),
                         'evidence_text': result.get('description', '')[:200],
-                        'confidence': 'strong'
-                    }
-            
-            # Check medium evidence
-            for evidence_kw in medium_evidence:
-                if evidence_kw in text:
-                    return {
-                        'has_evidence': True,
-                        'evidence_type': evidence_kw,
-                        'evidence_url': result.get('url'),
-                        'evidence_text': result.get('description', '')[:200],
-                        'confidence': 'medium'
+                        'confidence': confidence
                     }
         
         return {
@@ -215,64 +435,178 @@ class BraveSearchClient:
             'confidence': 'none'
         }
     
+    @staticmethod
+    def _first_keyword(pattern: re.Pattern, rank: Dict[str, int], text: str) -> Optional[str]:
+        """Matched keyword that comes first in list order, or None"""
+        hits = {match.group(1) for match in pattern.finditer(text)}
+        return min(hits, key=rank.__getitem__) if hits else None
+    
+    def combined_search(self, company_name: str, country: str = "",
+                        website: str = "") -> Dict:
+        """
+        Discover website and search SCE evidence with a single query
+        
+        Returns the find_evidence() dict plus 'website' (the discovered URL,
+        or None when a website was already known or none was found).
+        """
+        results = self.search(self._evidence_query(company_name, country, "", self._COMBINED_Q), count=10)
+        return self._combined_result(results, company_name, website)
+    
+    async def _acombined_search(self, session, company_name: str, country: str = "",
+                                website: str = "") -> Dict:
+        results = await self._asearch(session, self._evidence_query(company_name, country, "", self._COMBINED_Q), count=10)
+        return self._combined_result(results, company_name, website)
+    
+    def _combined_result(self, results: List[Dict], company_name: str, website: str) -> Dict:
+        combined = self._scan_evidence(results)
+        combined['website'] = None if website else self._pick_website(results, company_name)
+        return combined
+    
+    def batch_combined(self, leads: List[Dict]) -> List[Dict]:
+        """
+        Batch website discovery + evidence search, one Brave call per lead
+        
+        Fills the same fields as batch_discover() followed by
+        batch_evidence_search(), at half the API calls.
+        """
+        if self._use_async():
+            return asyncio.run(self.abatch_combined(leads))
+        
+        todo, skipped_no_company = self._select_for_evidence(leads)
+        results = []
+        for i, (_, company, country, website) in enumerate(todo):
+            # Log progress every 10 items
+            if (i + 1) % 10 == 0:
+                logger.info(f"Combined search progress: {i+1}/{len(todo)} processed")
+            try:
+                results.append(self.combined_search(company, country, website))
+            except Exception as e:
+                results.append(e)
+        
+        return self._apply_combined(leads, todo, results, skipped_no_company)
+    
+    async def abatch_combined(self, leads: List[Dict]) -> List[Dict]:
+        """Concurrent batch_combined (shares the token bucket)"""
+        todo, skipped_no_company = self._select_for_evidence(leads)
+        async with self._async_session() as session:
+            results = await asyncio.gather(
+                *[self._acombined_search(session, company, country, website)
+                  for _, company, country, website in todo],
+                return_exceptions=True
+            )
+        return self._apply_combined(leads, todo, results, skipped_no_company)
+    
+    def _apply_combined(self, leads: List[Dict], todo: List[Tuple[Dict, str, str, str]],
+                        results: List, skipped_no_company: int) -> List[Dict]:
+        # Website part: only leads that had none and were not opted out
+        discovery_todo = []
+        websites = []
+        skipped = {'has_website': 0, 'no_company': skipped_no_company}
+        for (lead, company, country, website), result in zip(todo, results):
+            if website:
+                skipped['has_website'] += 1
+            elif lead.get('needs_discovery') != False:
+                discovery_todo.append((lead, company, country))
+                websites.append(result if isinstance(result, Exception) else result.get('website'))
+        self._apply_discovery(leads, discovery_todo, websites, skipped)
+        
+        return self._apply_evidence(leads, todo, results, skipped_no_company)
+    
     def batch_discover(self, leads: List[Dict]) -> List[Dict]:
         """
         Batch website discovery for multiple leads
         
+        Runs the searches concurrently via abatch_discover() when aiohttp is
+        available; otherwise falls back to sequential calls.
+        
         Args:
             leads: List of lead dicts with 'company' and 'country'
             
         Returns:
             Updated leads with 'website' filled
         """
-        discovered = 0
-        skipped_has_website = 0
-        skipped_no_company = 0
-        failed = 0
+        if self._use_async():
+            return asyncio.run(self.abatch_discover(leads))
         
-        for i, lead in enumerate(leads):
-            # Handle pandas NaN values
-            website = lead.get('website')
-            if website and str(website) != 'nan':
-                skipped_has_website += 1
-                continue
-            
-            # Skip if marked as needs_discovery=False
-            if lead.get('needs_discovery') == False:
-                continue
-            
-            company = lead.get('company') or lead.get('company_name', '')
-            country = lead.get('country', '')
-            
-            # Handle NaN in company/country
-            if not company or str(company) == 'nan':
-                skipped_no_company += 1
-                continue
-            
-            if str(country) == 'nan':
-                country = ''
-            
+        todo, skipped = self._select_for_discovery(leads)
+        websites = []
+        for i, (_, company, country) in enumerate(todo):
             # Log progress every 10 items
             if (i + 1) % 10 == 0:
-                logger.info(f"Discovery progress: {i+1}/{len(leads)} processed, {discovered} found")
-            
-            # Discover website
+                logger.info(f"Discovery progress: {i+1}/{len(todo)} processed")
             try:
-                website = self.discover_website(company, country)
-                
-                if website:
-                    lead['website'] = website
-                    lead['website_source'] = 'brave_discovery'
-                    discovered += 1
-                else:
-                    failed += 1
+                websites.append(self.discover_website(company, country))
             except Exception as e:
-                logger.warning(f"Discovery failed for {company}: {e}")
+                websites.append(e)
+        
+        return self._apply_discovery(leads, todo, websites, skipped)
+    
+    async def abatch_discover(self, leads: List[Dict]) -> List[Dict]:
+        """Concurrent batch website discovery (shares the token bucket)"""
+        todo, skipped = self._select_for_discovery(leads)
+        async with self._async_session() as session:
+            websites = await asyncio.gather(
+                *[self._adiscover_website(session, company, country) for _, company, country in todo],
+                return_exceptions=True
+            )
+        return self._apply_discovery(leads, todo, websites, skipped)
+    
+    @staticmethod
+    def _clean(value) -> str:
+        """Blank out None / pandas NaN / 'nan' cell values"""
+        if value is None or value != value:
+            return ''
+        value = str(value)
+        return '' if value == 'nan' else value
+    
+    def _prenormalize(self, leads: List[Dict]) -> List[Tuple[Dict, str, str, str]]:
+        """Single pass: (lead, company, country, website) with NaN handled"""
+        clean = self._clean
+        return [
+            (lead,
+             clean(lead.get('company')) or clean(lead.get('company_name')),
+             clean(lead.get('country')),
+             clean(lead.get('website')))
+            for lead in leads
+        ]
+    
+    def _select_for_discovery(self, leads: List[Dict]) -> Tuple[List[Tuple[Dict, str, str]], Dict]:
+        """Pick leads needing discovery as (lead, company, country) tuples"""
+        todo = []
+        skipped = {'has_website': 0, 'no_company': 0}
+        
+        for lead, company, country, website in self._prenormalize(leads):
+            if website:
+                skipped['has_website'] += 1
+            # Skip if marked as needs_discovery=False
+            elif lead.get('needs_discovery') == False:
+                continue
+            elif not company:
+                skipped['no_company'] += 1
+            else:
+                todo.append((lead, company, country))
+        
+        return todo, skipped
+    
+    def _apply_discovery(self, leads: List[Dict], todo: List[Tuple[Dict, str, str]],
+                         websites: List, skipped: Dict) -> List[Dict]:
+        discovered = 0
+        failed = 0
+        
+        for (lead, company, _), website in zip(todo, websites):
+            if isinstance(website, Exception):
+                logger.warning(f"Discovery failed for {company}: {website}")
+                failed += 1
+            elif website:
+                lead['website'] = website
+                lead['website_source'] = 'brave_discovery'
+                discovered += 1
+            else:
                 failed += 1
         
         logger.info(f"Batch discovery: {discovered}/{len(leads)} websites found, "
-                   f"{skipped_has_website} already had website, "
-                   f"{skipped_no_company} had no company name, "
+                   f"{skipped['has_website']} already had website, "
+                   f"{skipped['no_company']} had no company name, "
                    f"{failed} failed")
         return leads
     
@@ -280,52 +614,68 @@ class BraveSearchClient:
         """
         Batch evidence search for multiple leads
         
+        Runs the searches concurrently via abatch_evidence_search() when
+        aiohttp is available; otherwise falls back to sequential calls.
+        
         Args:
             leads: List of lead dicts
             
         Returns:
             Updated leads with SCE evidence fields
         """
-        evidence_found = 0
-        skipped_no_company = 0
+        if self._use_async():
+            return asyncio.run(self.abatch_evidence_search(leads))
         
-        for i, lead in enumerate(leads):
-            company = lead.get('company') or lead.get('company_name', '')
-            country = lead.get('country', '')
-            website = lead.get('website', '')
-            
-            # Handle pandas NaN
-            if not company or str(company) == 'nan':
-                skipped_no_company += 1
-                continue
-            
-            if str(country) == 'nan':
-                country = ''
-            
-            if str(website) == 'nan':
-                website = ''
-            
+        todo, skipped_no_company = self._select_for_evidence(leads)
+        evidence = []
+        for i, (_, company, country, website) in enumerate(todo):
             # Log progress every 10 items
             if (i + 1) % 10 == 0:
-                logger.info(f"Evidence search progress: {i+1}/{len(leads)} processed, {evidence_found} found")
-            
-            # Search for evidence
+                logger.info(f"Evidence search progress: {i+1}/{len(todo)} processed")
             try:
-                evidence = self.find_evidence(company, country, website)
-                
-                # Add evidence fields to lead
-                lead['sce_has_evidence'] = evidence.get('has_evidence', False)
-                lead['sce_evidence_type'] = evidence.get('evidence_type', '')
-                lead['sce_evidence_url'] = evidence.get('evidence_url', '')
-                lead['sce_evidence_text'] = evidence.get('evidence_text', '')
-                lead['sce_confidence'] = evidence.get('confidence', 'none')
-                
-                if evidence.get('has_evidence'):
-                    evidence_found += 1
+                evidence.append(self.find_evidence(company, country, website))
             except Exception as e:
-                logger.warning(f"Evidence search failed for {company}: {e}")
+                evidence.append(e)
+        
+        return self._apply_evidence(leads, todo, evidence, skipped_no_company)
+    
+    async def abatch_evidence_search(self, leads: List[Dict]) -> List[Dict]:
+        """Concurrent batch evidence search (shares the token bucket)"""
+        todo, skipped_no_company = self._select_for_evidence(leads)
+        async with self._async_session() as session:
+            evidence = await asyncio.gather(
+                *[self._afind_evidence(session, company, country, website)
+                  for _, company, country, website in todo],
+                return_exceptions=True
+            )
+        return self._apply_evidence(leads, todo, evidence, skipped_no_company)
+    
+    def _select_for_evidence(self, leads: List[Dict]) -> Tuple[List[Tuple[Dict, str, str, str]], int]:
+        """Pick leads for evidence search as (lead, company, country, website) tuples"""
+        normalized = self._prenormalize(leads)
+        todo = [row for row in normalized if row[1]]
+        return todo, len(normalized) - len(todo)
+    
+    def _apply_evidence(self, leads: List[Dict], todo: List[Tuple[Dict, str, str, str]],
+                        evidence_list: List, skipped_no_company: int) -> List[Dict]:
+        evidence_found = 0
+        
+        for (lead, company, _, _), evidence in zip(todo, evidence_list):
+            if isinstance(evidence, Exception):
+                logger.warning(f"Evidence search failed for {company}: {evidence}")
                 lead['sce_has_evidence'] = False
                 lead['sce_confidence'] = 'error'
+                continue
+            
+            # Add evidence fields to lead
+            lead['sce_has_evidence'] = evidence.get('has_evidence', False)
+            lead['sce_evidence_type'] = evidence.get('evidence_type', '')
+            lead['sce_evidence_url'] = evidence.get('evidence_url', '')
+            lead['sce_evidence_text'] = evidence.get('evidence_text', '')
+            lead['sce_confidence'] = evidence.get('confidence', 'none')
+            
+            if evidence.get('has_evidence'):
+                evidence_found += 1
         
         logger.info(f"Batch evidence: {evidence_found}/{len(leads)} leads have SCE, "
                    f"{skipped_no_company} skipped (no company name)")
@@ -1,18 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
+import atexit
 import copy
+import html as html_lib
+import math
+import os
+import queue
+import re
+import shelve
+import threading
+import time
 
 from bs4 import BeautifulSoup
 
 from src.processors.entity_extractor import EntityExtractor
-from src.utils.evidence import record_evidence
+from src.utils.evidence import record_evidence_batch
 from src.utils.http_client import HttpClient
 from src.utils.logger import get_logger
 from src.utils.storage import save_text_cache
 
 logger = get_logger(__name__)
 
+# Quoted or unquoted href values; entities are decoded after the match
+_MAILTO_RE = re.compile(r"""href\s*=\s*(?:["']\s*mailto:([^"'?]+)|mailto:([^\s"'?>]+))""", re.I)
+_TEL_RE = re.compile(r"""href\s*=\s*(?:["']\s*tel:([^"'?]+)|tel:([^\s"'?>]+))""", re.I)
+
+# Process-wide domain caches, one shelve per path, shared by all enrichers
+_DOMAIN_STORES = {}
+_DOMAIN_STORE_LOCK = threading.Lock()
+
+
+def _open_domain_store(path):
+    with _DOMAIN_STORE_LOCK:
+        store = _DOMAIN_STORES.get(path)
+        if store is None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            try:
+                store = shelve.open(path)
+            except Exception as exc:
+                logger.warning(f"Domain cache unavailable at {path}: {exc}")
+                store = {}
+            _DOMAIN_STORES[path] = store
+        return store
+
+
+@atexit.register
+def _close_domain_stores():
+    with _DOMAIN_STORE_LOCK:
+        for store in _DOMAIN_STORES.values():
+            if hasattr(store, "close"):
+                store.close()
+        _DOMAIN_STORES.clear()
+
 
 class ContactEnricher:
     def __init__(
@@ -31,7 +72,17 @@ class ContactEnricher:
         self.client = HttpClient(settings=local_settings, policies=policies)
         self.extractor = EntityExtractor()
         self.evidence_path = evidence_path
-        self._domain_cache = {}
+        cache_path = self.cfg.get("domain_cache_path", "outputs/.domain_cache.db")
+        self._domain_cache = _open_domain_store(cache_path) if cache_path else {}
+        self.domain_cache_ttl = float(self.cfg.get("domain_cache_ttl", 7 * 86400))
+        self.fetch_workers = int(self.cfg.get("fetch_workers", 4))
+        self._keyword_res = {}
+
+        # Text cache + evidence log writes run on a background writer thread
+        self._evidence_q = queue.Queue()
+        self._writer = threading.Thread(target=self._evidence_writer, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
     def enrich(self, lead):
         if not self.cfg.get("enabled", False):
@@ -67,8 +118,8 @@ class ContactEnricher:
                 base_root = f"{parsed_base.scheme}://{parsed_base.netloc}"
             else:
                 base_root = base
-            if domain in self._domain_cache:
-                cached = self._domain_cache[domain]
+            cached = self._get_cached_domain(domain)
+            if cached is not None:
                 emails.update(cached.get("emails", []))
                 phones.update(cached.get("phones", []))
                 contact_urls.update(cached.get("contact_urls", []))
@@ -78,97 +129,44 @@ class ContactEnricher:
             base_html = self.client.get(base)
             if not base_html:
                 continue
+            base_soup = self._parse_html(base_html)
 
             candidates = [base]
             discovered_links = []
             if keywords:
-                discovered_links = self._find_contact_links(base_html, base, keywords)
+                discovered_links = self._find_contact_links(base_soup, base, keywords)
                 candidates.extend(discovered_links)
 
+            base_slash = base_root.rstrip("/") + "/"
             if not discovered_links:
-                for path in paths:
-                    candidates.append(urljoin(base_root.rstrip("/") + "/", path.lstrip("/")))
+                candidates.extend(urljoin(base_slash, path.lstrip("/")) for path in paths)
 
             # de-duplicate while preserving order
-            seen = set()
-            deduped = []
-            for url in candidates:
-                if url in seen:
-                    continue
-                seen.add(url)
-                deduped.append(url)
-            candidates = deduped
+            candidates = list(dict.fromkeys(candidates))
+            seen = set(candidates)
 
             fetched = 0
-            for url in candidates:
-                if fetched >= max_pages:
-                    break
-                html = base_html if url == base else self.client.get(url)
-                if not html:
-                    continue
+            for url, html in self._fetch_successful(candidates, max_pages, skip=base):
+                if url == base:
+                    html, soup = base_html, base_soup
+                else:
+                    soup = self._parse_html(html)
                 fetched += 1
-                text = self._html_to_text(html)
-                found["emails"].update(self.extractor.extract_emails(text))
-                found["phones"].update(self.extractor.extract_phones(text))
-                found["emails"].update(self._extract_mailto(html))
-                found["phones"].update(self._extract_tel(html))
-                found["contact_urls"].add(url)
-
-                content_hash = save_text_cache(url, text[:5000])
-                record_evidence(
-                    self.evidence_path,
-                    {
-                        "source_type": "contact_enrichment",
-                        "source_name": lead.get("company", ""),
-                        "url": url,
-                        "title": lead.get("company", ""),
-                        "snippet": text[:400].replace("\n", " ").strip(),
-                        "content_hash": content_hash,
-                        "fetched_at": datetime.utcnow().isoformat(timespec="seconds"),
-                    },
-                )
+                self._collect_page(url, html, soup, found, lead)
 
             if discovered_links and fetched < max_pages and not found["emails"] and not found["phones"]:
                 fallback = []
                 for path in paths:
-                    fallback_url = urljoin(base_root.rstrip("/") + "/", path.lstrip("/"))
+                    fallback_url = urljoin(base_slash, path.lstrip("/"))
                     if fallback_url in seen:
                         continue
                     fallback.append(fallback_url)
                     seen.add(fallback_url)
-                for url in fallback:
-                    if fetched >= max_pages:
-                        break
-                    html = self.client.get(url)
-                    if not html:
-                        continue
+                for url, html in self._fetch_successful(fallback, max_pages - fetched):
                     fetched += 1
-                    text = self._html_to_text(html)
-                    found["emails"].update(self.extractor.extract_emails(text))
-                    found["phones"].update(self.extractor.extract_phones(text))
-                    found["emails"].update(self._extract_mailto(html))
-                    found["phones"].update(self._extract_tel(html))
-                    found["contact_urls"].add(url)
-
-                    content_hash = save_text_cache(url, text[:5000])
-                    record_evidence(
-                        self.evidence_path,
-                        {
-                            "source_type": "contact_enrichment",
-                            "source_name": lead.get("company", ""),
-                            "url": url,
-                            "title": lead.get("company", ""),
-                            "snippet": text[:400].replace("\n", " ").strip(),
-                            "content_hash": content_hash,
-                            "fetched_at": datetime.utcnow().isoformat(timespec="seconds"),
-                        },
-                    )
-
-            self._domain_cache[domain] = {
-                "emails": found["emails"],
-                "phones": found["phones"],
-                "contact_urls": found["contact_urls"],
-            }
+                    self._collect_page(url, html, self._parse_html(html), found, lead)
+
+            self._set_cached_domain(domain, found)
             emails.update(found["emails"])
             phones.update(found["phones"])
             contact_urls.update(found["contact_urls"])
@@ -183,6 +181,23 @@ class ContactEnricher:
 
         return lead
 
+    def _get_cached_domain(self, domain):
+        with _DOMAIN_STORE_LOCK:
+            cached = self._domain_cache.get(domain)
+        if not cached or time.time() - cached.get("ts", 0) > self.domain_cache_ttl:
+            return None
+        return cached
+
+    def _set_cached_domain(self, domain, found):
+        entry = {
+            "ts": time.time(),
+            "emails": sorted(found["emails"]),
+            "phones": sorted(found["phones"]),
+            "contact_urls": sorted(found["contact_urls"]),
+        }
+        with _DOMAIN_STORE_LOCK:
+            self._domain_cache[domain] = entry
+
     def _normalize_url(self, url):
         url = str(url).strip()
         if not url:
@@ -193,14 +208,137 @@ class ContactEnricher:
             url = f"https://{url}"
         return url
 
-    def _html_to_text(self, html):
-        soup = BeautifulSoup(html, "html.parser")
+    def _fetch_pages(self, urls, skip=None):
+        """Fetch candidate pages concurrently; returns (url, html) in input order."""
+        to_fetch = [u for u in urls if u != skip]
+        workers = min(self.fetch_workers, len(to_fetch), self._useful_workers(to_fetch))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                fetched = dict(zip(to_fetch, ex.map(self.client.get, to_fetch)))
+        else:
+            fetched = {u: self.client.get(u) for u in to_fetch}
+        return [(u, fetched.get(u)) for u in urls]
+
+    def _useful_workers(self, urls):
+        """
+        Upper bound on threads that can have requests in flight for `urls`.
+
+        HttpClient starts requests to one host at least min_delay apart, so
+        per host only about timeout / min_delay fetches can overlap; more
+        threads would just sleep on the rate limit. Distinct hosts do not
+        wait on each other.
+        """
+        min_delay = self.client.min_delay
+        if min_delay <= 0:
+            return len(urls)
+        hosts = len({urlparse(u).netloc for u in urls})
+        return hosts * max(1, math.ceil(self.client.timeout / min_delay))
+
+    def _fetch_successful(self, urls, limit, skip=None):
+        """
+        (url, html) of the first `limit` candidates that fetch, in input order.
+
+        Windows of the still-missing page count are fetched concurrently and
+        refilled from the remaining candidates, so a failed fetch (404 on a
+        guessed path) does not use up a slot. `skip` is counted as fetched
+        without a request; its html is returned as None.
+        """
+        pages = []
+        pos = 0
+        while len(pages) < limit and pos < len(urls):
+            window = urls[pos : pos + limit - len(pages)]
+            pos += len(window)
+            for url, html in self._fetch_pages(window, skip=skip):
+                if html or url == skip:
+                    pages.append((url, html))
+        return pages
+
+    def _parse_html(self, html):
+        # Parse each page once (C parser); all helpers below share the soup
+        return BeautifulSoup(html, "lxml")
+
+    def _collect_page(self, url, html, soup, found, lead):
+        text = self._html_to_text(soup)
+        found["emails"].update(self.extractor.extract_emails(text))
+        found["phones"].update(self.extractor.extract_phones(text))
+        if self.cfg.get("mailto_via_soup", False):
+            # DOM path: decodes entity-encoded hrefs the regexes would miss
+            anchors = soup.find_all("a", href=True)
+            found["emails"].update(self._extract_mailto_soup(anchors))
+            found["phones"].update(self._extract_tel_soup(anchors))
+        else:
+            found["emails"].update(self._extract_mailto(html))
+            found["phones"].update(self._extract_tel(html))
+        found["contact_urls"].add(url)
+
+        self._evidence_q.put(
+            (
+                url,
+                text[:5000],
+                {
+                    "source_type": "contact_enrichment",
+                    "source_name": lead.get("company", ""),
+                    "url": url,
+                    "title": lead.get("company", ""),
+                    "snippet": text[:400].replace("\n", " ").strip(),
+                    "fetched_at": datetime.utcnow().isoformat(timespec="seconds"),
+                },
+            )
+        )
+
+    def _evidence_writer(self):
+        while True:
+            batch = [self._evidence_q.get()]
+            while True:
+                try:
+                    batch.append(self._evidence_q.get_nowait())
+                except queue.Empty:
+                    break
+            items = [item for item in batch if item is not None]
+            try:
+                for url, text, payload in items:
+                    payload["content_hash"] = save_text_cache(url, text)
+                if items:
+                    record_evidence_batch(self.evidence_path, [payload for _, _, payload in items])
+            except Exception as exc:
+                logger.error(f"Failed to write contact evidence: {exc}")
+            finally:
+                for _ in batch:
+                    self._evidence_q.task_done()
+            if len(items) < len(batch):
+                return
+
+    def flush(self):
+        """Block until all queued evidence has been written."""
+        self._evidence_q.join()
+
+    def close(self):
+        """Flush pending evidence and stop the writer thread."""
+        if self._writer.is_alive():
+            self._evidence_q.put(None)
+            self._writer.join()
+
+    def _html_to_text(self, soup):
         return soup.get_text(separator="\n", strip=True)
 
     def _extract_mailto(self, html):
+        return self._href_values(_MAILTO_RE, html)
+
+    def _extract_tel(self, html):
+        return self._href_values(_TEL_RE, html)
+
+    def _href_values(self, pattern, html):
+        # "info&#64;acme.com" -> "info@acme.com", as the soup path reads it
+        values = set()
+        for quoted, unquoted in pattern.findall(html):
+            value = html_lib.unescape(quoted or unquoted).split("?", 1)[0].strip()
+            if value:
+                values.add(value)
+        return values
+
+    def _extract_mailto_soup(self, anchors):
         emails = set()
-        soup = BeautifulSoup(html, "html.parser")
-        for link in soup.find_all("a", href=True):
+        for link in anchors:
             href = link["href"].strip()
             if href.lower().startswith("mailto:"):
                 addr = href.split(":", 1)[1].split("?")[0]
@@ -208,10 +346,9 @@ class ContactEnricher:
                     emails.add(addr)
         return emails
 
-    def _extract_tel(self, html):
+    def _extract_tel_soup(self, anchors):
         phones = set()
-        soup = BeautifulSoup(html, "html.parser")
-        for link in soup.find_all("a", href=True):
+        for link in anchors:
             href = link["href"].strip()
             if href.lower().startswith("tel:"):
                 phone = href.split(":", 1)[1].split("?")[0]
@@ -219,18 +356,25 @@ class ContactEnricher:
                     phones.add(phone)
         return phones
 
-    def _find_contact_links(self, html, base_url, keywords):
+    def _keyword_re(self, keywords):
+        key = tuple(keywords)
+        pattern = self._keyword_res.get(key)
+        if pattern is None:
+            pattern = re.compile("|".join(re.escape(k) for k in key))
+            self._keyword_res[key] = pattern
+        return pattern
+
+    def _find_contact_links(self, soup, base_url, keywords):
         links = []
-        soup = BeautifulSoup(html, "html.parser")
         base_domain = urlparse(base_url).netloc.lower()
+        keyword_re = self._keyword_re(keywords)
         for a in soup.find_all("a", href=True):
             href = a["href"].strip()
-            text = a.get_text(" ", strip=True).lower()
-            if not href or href.startswith("mailto:") or href.startswith("tel:"):
+            if not href or href.startswith(("mailto:", "tel:", "#")):
                 continue
-            if href.startswith("#"):
-                continue
-            if not any(k in href.lower() or k in text for k in keywords):
+            text = a.get_text(" ", strip=True).lower()
+            # One search over href + anchor text; NUL keeps matches from spanning both
+            if not keyword_re.search(href.lower() + "\x00" + text):
                 continue
             full = urljoin(base_url.rstrip("/") + "/", href)
             if urlparse(full).netloc.lower() != base_domain:
@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 """Contactability scoring for leads."""
 
+import ast
+import json
+import math
+import re
+from functools import lru_cache
 from typing import Dict, Tuple
 
+import numpy as np
+import pandas as pd
+
 
 def _safe_str(val) -> str:
     """Safely convert value to string, handling NaN."""
@@ -17,35 +25,56 @@ def _safe_list(val) -> list:
     """Safely convert value to list, handling NaN and string-encoded lists."""
     if val is None:
         return []
-    if isinstance(val, float) and val != val:  # NaN check
+    if isinstance(val, float) and math.isnan(val):
         return []
     if isinstance(val, list):
         return val
-    # Handle string-encoded lists from CSV
     if isinstance(val, str):
-        val = val.strip()
-        if val.startswith('[') and val.endswith(']'):
-            try:
-                import ast
-                parsed = ast.literal_eval(val)
-                if isinstance(parsed, list):
-                    return parsed
-            except:
-                pass
-        # Could be comma-separated
-        if ',' in val:
-            return [x.strip() for x in val.split(',') if x.strip()]
-        if val:
-            return [val]
+        return list(_parse_list_str(val))
     return []
 
 
+@lru_cache(maxsize=8192)
+def _parse_list_str(val: str) -> tuple:
+    """Parse a CSV cell into list items (cached; returns an immutable tuple)."""
+    val = val.strip()
+    # Handle string-encoded lists from CSV
+    if val.startswith('[') and val.endswith(']'):
+        # Fast path: JSON, or a Python repr whose quotes can be swapped safely
+        candidate = val if '"' in val else val.replace("'", '"')
+        try:
+            parsed = json.loads(candidate)
+            if isinstance(parsed, list):
+                return tuple(parsed)
+        except ValueError:
+            pass
+        try:
+            parsed = ast.literal_eval(val)
+            if isinstance(parsed, list):
+                return tuple(parsed)
+        except Exception:
+            pass
+    # Could be comma-separated
+    if ',' in val:
+        return tuple(x.strip() for x in val.split(',') if x.strip())
+    if val:
+        return (val,)
+    return ()
+
+
 class ContactabilityScorer:
     """İletişim kalitesi puanlaması."""
 
     GENERIC_PREFIXES = ["noreply", "no-reply", "donotreply", "mailer"]
     INFO_PREFIXES = ["info", "contact", "hello", "enquiry", "inquiry"]
     DEPARTMENT_PREFIXES = ["sales", "export", "support", "marketing", "purchase", "procurement"]
+    EMAIL_TYPE_BY_SCORE = {10: "info", 30: "department", 60: "personal", 20: "unknown"}
+
+    # Precomputed lookups: str.startswith(tuple) and set membership run in C
+    _GENERIC_TUP = tuple(GENERIC_PREFIXES)
+    _INFO_SET = frozenset(INFO_PREFIXES)
+    _DEPT_TUP = tuple(DEPARTMENT_PREFIXES)
+    _PERSONAL_RE = re.compile(r"[._]")
 
     def score_email(self, email: str) -> Tuple[int, str]:
         if not email:
@@ -54,13 +83,13 @@ class ContactabilityScorer:
         if not email or "@" not in email:
             return 0, "no_email"
         local_part = email.split("@")[0].lower()
-        if any(local_part.startswith(p) for p in self.GENERIC_PREFIXES):
+        if local_part.startswith(self._GENERIC_TUP):
             return 0, "generic"
-        if any(local_part == p for p in self.INFO_PREFIXES):
+        if local_part in self._INFO_SET:
             return 10, "info"
-        if any(local_part.startswith(p) for p in self.DEPARTMENT_PREFIXES):
+        if local_part.startswith(self._DEPT_TUP):
             return 30, "department"
-        if "." in local_part or "_" in local_part:
+        if self._PERSONAL_RE.search(local_part):
             return 60, "personal"
         return 20, "unknown"
 
@@ -99,3 +128,63 @@ class ContactabilityScorer:
         lead["contactability_score"] = min(score, 100)
         lead["contactability_details"] = details
         return lead
+
+    def score_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized score_lead over a DataFrame; returns a scored copy."""
+        out = df.copy()
+        n = len(out)
+
+        def column(name):
+            if name in out.columns:
+                return out[name].reset_index(drop=True)
+            return pd.Series([None] * n, dtype=object)
+
+        # Best email: explode to one row per email, score, take max per lead
+        emails = column("emails_extracted").map(_safe_list).explode().dropna()
+        emails = emails.astype(str).str.strip()
+        emails = emails[emails.str.contains("@", regex=False)]
+        local = emails.str.split("@").str[0].str.lower()
+        email_scores = pd.Series(
+            np.select(
+                [
+                    local.str.startswith(self._GENERIC_TUP),
+                    local.isin(self._INFO_SET),
+                    local.str.startswith(self._DEPT_TUP),
+                    local.str.contains(self._PERSONAL_RE, regex=True),
+                ],
+                [0, 10, 30, 60],
+                default=20,
+            ),
+            index=local.index,
+        )
+        best_email = (
+            email_scores.groupby(level=0).max().reindex(range(n), fill_value=0).to_numpy()
+        )
+
+        has_phone = column("phones_extracted").map(_safe_list).map(bool).to_numpy()
+        has_linkedin = column("linkedin_xray").map(_safe_str).ne("").to_numpy()
+        has_decision_maker = (
+            column("contact_person").map(_safe_str).ne("")
+            & column("contact_role").map(_safe_str).ne("")
+        ).to_numpy()
+
+        score = best_email + 20 * has_phone + 15 * has_linkedin + 25 * has_decision_maker
+
+        details = []
+        for email_score, phone, linkedin, decision_maker in zip(
+            best_email, has_phone, has_linkedin, has_decision_maker
+        ):
+            row = []
+            if email_score > 0:
+                row.append(f"email:{self.EMAIL_TYPE_BY_SCORE[email_score]}:{email_score}")
+            if phone:
+                row.append("phone:direct:20")
+            if linkedin:
+                row.append("linkedin:xray:15")
+            if decision_maker:
+                row.append("decision_maker:named:25")
+            details.append(row)
+
+        out["contactability_score"] = np.minimum(score, 100)
+        out["contactability_details"] = details
+        return out
@@ -8,10 +8,24 @@ satın alabilecek şirketleri tespit eder.
 import os
 import re
 import logging
+import multiprocessing as mp
 from typing import Dict, List, Optional
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -32,6 +46,17 @@ class CustomerQualifier:
     - Ram makinesi kullanan terbiye tesisleri
     """
     
+    # Kategori başına puan ve gerekçe etiketi (sözlük sırası korunur)
+    CATEGORY_SCORES = {
+        "oem_brands": (25, "OEM marka"),
+        "machinery": (20, "Makine referansı"),
+        "operations": (15, "Finishing operasyonu"),
+        "product_categories": (10, "Ürün kategorisi"),
+    }
+    
+    # Bu satır sayısının üzerinde qualify_all çekirdeklere dağıtılır
+    PARALLEL_MIN_ROWS = 5000
+    
     def __init__(self):
         self.base_path = Path(__file__).parent.parent.parent
         
@@ -92,11 +117,98 @@ class CustomerQualifier:
         ]
         
         # Yüksek güvenilirlik kaynakları (doğrudan müşteri)
-        self.high_confidence_sources = [
+        self.high_confidence_sources = frozenset({
             "known_manufacturer",
             "oem_customer", 
             "precision_search"
-        ]
+        })
+        
+        # Öncelikli pazarlar
+        self.priority_countries = frozenset({"turkey", "türkiye", "egypt", "brazil", "argentina", "pakistan", "india"})
+        
+        # Eşleştirme küçük harfli metin üzerinde yapılır; listeleri bir kez normalize et
+        self.qualifying_keywords = {
+            category: [k.lower() for k in keywords]
+            for category, keywords in self.qualifying_keywords.items()
+        }
+        self.disqualifying_keywords = [k.lower() for k in self.disqualifying_keywords]
+        
+        # Toplu değerlendirme için tek geçişlik regex'ler
+        self._category_res = {
+            category: self._alternation(keywords)
+            for category, keywords in self.qualifying_keywords.items()
+        }
+        self._disqualify_re = self._alternation(self.disqualifying_keywords)
+        self._priority_country_re = self._alternation(self.priority_countries)
+        
+        # qualify_lead için tüm anahtar kelimeleri tek geçişte tarayan otomat
+        self._automaton = self._build_automaton() if AHOCORASICK_AVAILABLE else None
+    
+    def _build_automaton(self):
+        """
+        Nitelendirici ve diskalifiye edici kelimelerden Aho-Corasick otomatı kur.
+        
+        Aynı kelime birden fazla kategoride olabildiği için her kelimenin değeri
+        (kelime, ((kategori, liste_sırası), ...)) şeklindedir; diskalifiye
+        kelimeleri kategori None ile işaretlenir.
+        """
+        entries: Dict[str, List] = {}
+        for category, keywords in self.qualifying_keywords.items():
+            for index, keyword in enumerate(keywords):
+                entries.setdefault(keyword, []).append((category, index))
+        for keyword in self.disqualifying_keywords:
+            entries.setdefault(keyword, []).append((None, 0))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, hits in entries.items():
+            automaton.add_word(keyword, (keyword, tuple(hits)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _keyword_hits(self, all_text: str):
+        """
+        Metindeki anahtar kelime eşleşmelerini bul.
+        
+        Returns:
+            (first_hit(kategori) -> listede ilk eşleşen kelime ya da None,
+             eşleşen diskalifiye kelimeleri)
+            
+            Otomat varsa her şey tek geçişte bulunur; yoksa kategori taraması
+            first_hit çağrıldığında yapılır, böylece erken çıkışta atlanır.
+        """
+        if self._automaton is not None:
+            best = {}
+            disqualifiers = set()
+            for _, (keyword, hits) in self._automaton.iter(all_text):
+                for category, index in hits:
+                    if category is None:
+                        disqualifiers.add(keyword)
+                    elif category not in best or index < best[category][0]:
+                        best[category] = (index, keyword)
+            first_hits = {category: keyword for category, (_, keyword) in best.items()}
+            return first_hits.get, disqualifiers
+        
+        def first_hit(category: str) -> Optional[str]:
+            if not self._category_res[category].search(all_text):
+                return None
+            return next(k for k in self.qualifying_keywords[category] if k in all_text)
+        
+        disqualifiers = set()
+        if self._disqualify_re.search(all_text):
+            disqualifiers = {k for k in self.disqualifying_keywords if k in all_text}
+        return first_hit, disqualifiers
+    
+    @staticmethod
+    def _alternation(keywords: List[str]) -> "re.Pattern":
+        """Anahtar kelimelerden tek bir alternation regex derle."""
+        return re.compile("|".join(map(re.escape, keywords)))
+    
+    @staticmethod
+    def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+        """Kolonu küçük harfli string Series olarak döndür (yoksa boş)."""
+        if column not in df.columns:
+            return pd.Series("", index=df.index, dtype=object)
+        return df[column].fillna("").astype(str).str.lower()
     
     def qualify_lead(self, lead: Dict) -> Dict:
         """
@@ -108,13 +220,10 @@ class CustomerQualifier:
             - qualification_score: int (0-100)
             - qualification_reason: str
         """
-        company = str(lead.get("company", "")).lower()
-        context = str(lead.get("context", "")).lower()
+        # Combine all text for analysis (one str/lower pass over the joined text)
+        all_text = f"{lead.get('company', '')} {lead.get('context', '')}".lower()
         source_type = str(lead.get("source_type", "")).lower()
         
-        # Combine all text for analysis
-        all_text = f"{company} {context}"
-        
         # Start with base score
         score = 0
         reasons = []
@@ -124,34 +233,32 @@ class CustomerQualifier:
             score += 60
             reasons.append(f"Yüksek güvenilirlik kaynağı: {source_type}")
         
-        # 2. Check for qualifying keywords
-        for category, keywords in self.qualifying_keywords.items():
-            for keyword in keywords:
-                if keyword in all_text:
-                    if category == "oem_brands":
-                        score += 25
-                        reasons.append(f"OEM marka: {keyword}")
-                    elif category == "machinery":
-                        score += 20
-                        reasons.append(f"Makine referansı: {keyword}")
-                    elif category == "operations":
-                        score += 15
-                        reasons.append(f"Finishing operasyonu: {keyword}")
-                    elif category == "product_categories":
-                        score += 10
-                        reasons.append(f"Ürün kategorisi: {keyword}")
-                    break  # Only count once per category
+        first_hit, disqualifiers = self._keyword_hits(all_text)
+        
+        # Disqualifier penalties are applied up front so the cap check below
+        # is exact; their reasons are still listed after the categories.
+        score -= 30 * len(disqualifiers)
+        
+        # 2. Check for qualifying keywords (only count once per category)
+        for category in self.qualifying_keywords:
+            if score >= 100:
+                # Already capped; reaching 100 takes the source bonus plus at
+                # least two categories, so the 3 reported reasons are fixed too
+                break
+            keyword = first_hit(category)
+            if keyword is not None:
+                weight, label = self.CATEGORY_SCORES[category]
+                score += weight
+                reasons.append(f"{label}: {keyword}")
         
         # 3. Check for disqualifying keywords
         for keyword in self.disqualifying_keywords:
-            if keyword in all_text:
-                score -= 30
+            if keyword in disqualifiers:
                 reasons.append(f"Diskalifiye: {keyword}")
         
         # 4. Country bonus (priority markets)
         country = str(lead.get("country", "")).lower()
-        priority_countries = ["turkey", "türkiye", "egypt", "brazil", "argentina", "pakistan", "india"]
-        if any(c in country for c in priority_countries):
+        if self._priority_country_re.search(country):
             score += 10
             reasons.append(f"Öncelikli pazar: {country}")
         
@@ -168,17 +275,18 @@ class CustomerQualifier:
         return lead
     
     def qualify_all(self, leads_df: pd.DataFrame) -> pd.DataFrame:
-        """Tüm lead'leri değerlendir."""
-        logger.info(f"🎯 Qualifying {len(leads_df)} leads...")
-        
-        qualified_leads = []
+        """
+        Tüm lead'leri değerlendir.
         
-        for _, row in leads_df.iterrows():
-            lead = row.to_dict()
-            qualified = self.qualify_lead(lead)
-            qualified_leads.append(qualified)
+        qualify_lead ile aynı kuralları kolon bazında uygular: her kategori
+        tek bir regex taramasıyla işaretlenir, gerekçe için hangi anahtar
+        kelimenin eşleştiği sadece eşleşen satırlarda aranır.
+        """
+        logger.info(f"🎯 Qualifying {len(leads_df)} leads...")
         
-        result_df = pd.DataFrame(qualified_leads)
+        result_df = self._qualify_parallel(leads_df)
+        if result_df is None:
+            result_df = self._qualify_frame(leads_df)
         
         # Stats
         qualified_count = result_df["is_qualified"].sum()
@@ -186,6 +294,104 @@ class CustomerQualifier:
         
         return result_df
     
+    def _qualify_parallel(self, leads_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Büyük tabloları CPU çekirdeklerine bölerek değerlendir.
+        
+        Küçük tablolarda (havuz kurma maliyeti baskın) veya havuz
+        başlatılamazsa None döner; çağıran seri yola düşer.
+        """
+        workers = min(mp.cpu_count(), len(leads_df) // self.PARALLEL_MIN_ROWS + 1)
+        if len(leads_df) <= self.PARALLEL_MIN_ROWS or workers < 2:
+            return None
+        
+        size = -(-len(leads_df) // workers)
+        chunks = [leads_df.iloc[i:i + size] for i in range(0, len(leads_df), size)]
+        try:
+            with mp.Pool(workers) as pool:
+                parts = pool.map(_qualify_chunk, chunks)
+        except Exception as e:
+            logger.warning(f"Parallel qualification failed, falling back to serial: {e}")
+            return None
+        return pd.concat(parts)
+    
+    def _qualify_frame(self, leads_df: pd.DataFrame) -> pd.DataFrame:
+        """qualify_all'un vektörel çekirdeği (loglama yok)."""
+        # Shallow copy: only the new qualification columns are allocated,
+        # the input's existing columns are shared rather than duplicated
+        result_df = leads_df.copy(deep=False)
+        n = len(result_df)
+        
+        company = self._text_column(result_df, "company")
+        context = self._text_column(result_df, "context")
+        all_text = company + " " + context
+        source_type = self._text_column(result_df, "source_type")
+        country = self._text_column(result_df, "country")
+        
+        score = np.zeros(n, dtype=np.int32)
+        reason_cols = []
+        
+        def add_reason(mask: np.ndarray, texts) -> None:
+            col = np.full(n, None, dtype=object)
+            col[mask] = texts
+            reason_cols.append(col)
+        
+        # 1. High confidence sources
+        mask = source_type.isin(self.high_confidence_sources).to_numpy()
+        score[mask] += 60
+        add_reason(mask, ("Yüksek güvenilirlik kaynağı: " + source_type[mask]).to_numpy())
+        
+        # 2. Qualifying keywords - once per category, first keyword in list order
+        for category, keywords in self.qualifying_keywords.items():
+            weight, label = self.CATEGORY_SCORES[category]
+            mask = all_text.str.contains(self._category_res[category], na=False).to_numpy()
+            score[mask] += weight
+            first_hit = all_text[mask].map(lambda text: next(k for k in keywords if k in text))
+            add_reason(mask, (f"{label}: " + first_hit).to_numpy())
+        
+        # 3. Disqualifying keywords - every match counts
+        any_disqualifier = all_text.str.contains(self._disqualify_re, na=False).to_numpy()
+        if any_disqualifier.any():
+            candidates = all_text[any_disqualifier]
+            for keyword in self.disqualifying_keywords:
+                mask = np.zeros(n, dtype=bool)
+                mask[any_disqualifier] = candidates.str.contains(keyword, regex=False).to_numpy()
+                score[mask] -= 30
+                add_reason(mask, f"Diskalifiye: {keyword}")
+        
+        # 4. Country bonus
+        mask = country.str.contains(self._priority_country_re, na=False).to_numpy()
+        score[mask] += 10
+        add_reason(mask, ("Öncelikli pazar: " + country[mask]).to_numpy())
+        
+        # 5-6. Cap score and qualify
+        score = np.clip(score, 0, 100)
+        result_df["is_qualified"] = score >= 50
+        result_df["qualification_score"] = score
+        result_df["qualification_reason"] = [
+            "; ".join([r for r in row if r is not None][:3]) or "Yetersiz veri"
+            for row in zip(*reason_cols)
+        ] if n else []
+        
+        return result_df
+    
+    @staticmethod
+    def _read_leads(path) -> pd.DataFrame:
+        """
+        Lead CSV'sini oku.
+        
+        Standart pandas okuyucu kullanılır; Arrow okuyucu tarih/sayı
+        kolonlarını kendisi çözümleyip çıktıdaki değerleri değiştirdiği
+        için kullanılmaz. pyarrow varsa metin (object) kolonları okunduktan
+        sonra Arrow string'e çevrilir (daha az bellek, str.* işlemleri C'de
+        çalışır); değerler aynen korunur.
+        """
+        df = pd.read_csv(path)
+        if PYARROW_AVAILABLE:
+            text_cols = df.select_dtypes(include="object").columns
+            df[text_cols] = df[text_cols].astype("string[pyarrow]")
+        return df
+    
     def filter_real_customers(self, input_path: str = None, output_path: str = None) -> pd.DataFrame:
         """
         Sadece gerçek müşterileri filtrele ve kaydet.
@@ -200,7 +406,7 @@ class CustomerQualifier:
         logger.info("=" * 60)
         
         # Load leads
-        df = pd.read_csv(input_path)
+        df = self._read_leads(input_path)
         logger.info(f"Loaded {len(df)} leads from {input_path}")
         
         # Qualify all
@@ -209,39 +415,56 @@ class CustomerQualifier:
         # Filter only qualified
         real_customers = qualified_df[qualified_df["is_qualified"] == True].copy()
         
-        # Sort by qualification score
-        real_customers = real_customers.sort_values("qualification_score", ascending=False)
+        # Compact dtypes for the sort / value_counts / to_csv below
+        real_customers["qualification_score"] = real_customers["qualification_score"].astype("int8")
+        real_customers["is_qualified"] = real_customers["is_qualified"].astype(bool)
+        for col in ("source_type", "country"):
+            if col in real_customers:
+                real_customers[col] = real_customers[col].astype("category")
+        
+        # Sort by qualification score (stable sort on int8 -> numpy radix sort, O(n))
+        real_customers = real_customers.sort_values("qualification_score", ascending=False, kind="stable")
         
         # Save
         real_customers.to_csv(output_path, index=False)
         logger.info(f"💾 Saved {len(real_customers)} qualified customers to {output_path}")
         
-        # Print summary
-        logger.info("\n" + "=" * 60)
-        logger.info("📊 QUALIFICATION SUMMARY")
-        logger.info("=" * 60)
-        logger.info(f"Total leads: {len(df)}")
-        logger.info(f"Qualified customers: {len(real_customers)} ({len(real_customers)/len(df)*100:.1f}%)")
-        
-        logger.info("\nBy Source Type:")
-        for source in real_customers["source_type"].value_counts().head(10).items():
-            logger.info(f"  {source[0]}: {source[1]}")
+        # Print summary (one record instead of ~40 separate log calls)
+        lines = [
+            "",
+            "=" * 60,
+            "📊 QUALIFICATION SUMMARY",
+            "=" * 60,
+            f"Total leads: {len(df)}",
+            f"Qualified customers: {len(real_customers)} ({len(real_customers)/len(df)*100:.1f}%)",
+            "",
+            "By Source Type:",
+        ]
+        for source, count in real_customers["source_type"].value_counts().head(10).items():
+            lines.append(f"  {source}: {count}")
         
-        logger.info("\nBy Country:")
-        for country in real_customers["country"].value_counts().head(10).items():
-            logger.info(f"  {country[0]}: {country[1]}")
+        lines += ["", "By Country:"]
+        for country, count in real_customers["country"].value_counts().head(10).items():
+            lines.append(f"  {country}: {count}")
         
-        logger.info("\nTop 20 Qualified Customers:")
-        for _, row in real_customers.head(20).iterrows():
+        lines += ["", "Top 20 Qualified Customers:"]
+        for row in real_customers.head(20).to_dict("records"):
             company = str(row.get("company", ""))[:40]
             country = str(row.get("country", ""))
             score = row.get("qualification_score", 0)
             reason = str(row.get("qualification_reason", ""))[:50]
-            logger.info(f"  [{score:3.0f}] {company:40} | {country:12} | {reason}")
+            lines.append(f"  [{score:3.0f}] {company:40} | {country:12} | {reason}")
+        
+        logger.info("\n".join(lines))
         
         return real_customers
 
 
+def _qualify_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """multiprocessing işçisi: bir parçayı kendi qualifier'ı ile değerlendir."""
+    return CustomerQualifier()._qualify_frame(chunk)
+
+
 def main():
     """Run customer qualification."""
     qualifier = CustomerQualifier()
@@ -7,8 +7,29 @@ import re
 from typing import List, Dict, Optional
 import logging
 
+import pandas as pd
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Precompiled once at import; these run for every lead in the hot path
+_NOISE_PATTERNS = [
+    re.compile(r"\b(?:event|summit|conference|review|news|expo|fair|exhibition)\b"),
+    re.compile(r"^(?:the |a )?(?:textile|dyeing|finishing|machine)$"),
+    re.compile(r"\d{4}\s*(?:event|summit|conference)"),  # "2024 event"
+]
+_NOISE_RE = re.compile("|".join(p.pattern for p in _NOISE_PATTERNS))
+_SHORT_SUFFIX_RE = re.compile(r'\w+\s+(?:ltd|inc|llc|gmbh|sa|srl)')
+_PROTOCOL_RE = re.compile(r'^https?://')
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\.]')
+_PHONE_DIGIT_RE = re.compile(r'\d')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class DataCleaner:
     """
@@ -17,16 +38,16 @@ class DataCleaner:
     """
     
     # Noise patterns - companies that aren't real businesses
-    NOISE_KEYWORDS = [
+    NOISE_KEYWORDS = frozenset({
         "event", "news", "textile", "dyeing", "finishing", 
         "machine", "manufacturer", "limited", "review", "yarn",
         "summit", "conference", "expo", "fair", "exhibition",
         "association", "council", "federation", "chamber"
-    ]
+    })
     
     # GPT Audit: Non-customer entity types to filter
     # These are NOT stenter customers - they don't have finishing lines
-    NON_CUSTOMER_INDICATORS = [
+    NON_CUSTOMER_INDICATORS = frozenset({
         # Labels/Packaging (not fabric finishing)
         "labels", "label", "labeling", "packaging", "etiket",
         # Plastic/Fiber (different machinery)
@@ -49,10 +70,10 @@ class DataCleaner:
         "tv channel", "television", "radio",
         # Rugs/Carpets (different machinery, not stenter)
         "rug", "rugs", "carpet backing",
-    ]
+    })
     
     # Association/Fair domains to block
-    DOMAIN_BLOCKLIST = [
+    DOMAIN_BLOCKLIST = frozenset({
         # Certification databases (NOT company sites)
         "global-trace-base.org",
         "oeko-tex.com",
@@ -84,14 +105,14 @@ class DataCleaner:
         "kompass.com",
         "europages.com",
         "zoominfo.com",
-    ]
+    })
     
     # Generic terms that shouldn't be company names alone
-    GENERIC_TERMS = [
+    GENERIC_TERMS = frozenset({
         "textile", "dyeing", "finishing", "knitting", "weaving",
         "fabric", "garment", "apparel", "clothing", "yarn",
         "cotton", "polyester", "denim", "jersey"
-    ]
+    })
     
     def __init__(self, config: Optional[Dict] = None):
         """
@@ -101,8 +122,19 @@ class DataCleaner:
             config: Optional dict with 'noise_keywords' and 'blocked_domains'
         """
         if config:
-            self.NOISE_KEYWORDS.extend(config.get('noise_keywords', []))
-            self.DOMAIN_BLOCKLIST.extend(config.get('blocked_domains', []))
+            self.NOISE_KEYWORDS = self.NOISE_KEYWORDS | frozenset(config.get('noise_keywords', []))
+            self.DOMAIN_BLOCKLIST = self.DOMAIN_BLOCKLIST | frozenset(config.get('blocked_domains', []))
+        
+        # Single substring alternation over the (possibly extended) blocklist
+        self._blocklist_re = re.compile("|".join(map(re.escape, self.DOMAIN_BLOCKLIST)))
+        
+        # One-pass scanner for NON_CUSTOMER_INDICATORS (None -> substring loop)
+        self._nc_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._nc_automaton = ahocorasick.Automaton()
+            for indicator in self.NON_CUSTOMER_INDICATORS:
+                self._nc_automaton.add_word(indicator, indicator)
+            self._nc_automaton.make_automaton()
     
     def is_noise(self, company_name: str) -> bool:
         """
@@ -128,30 +160,24 @@ class DataCleaner:
         
         # Single generic word
         if len(words) == 1 and name_lower in self.GENERIC_TERMS:
-            logger.debug(f"Noise: Single generic term '{company_name}'")
+            logger.debug("Noise: Single generic term '%s'", company_name)
             return True
         
         # Two words: Country + Generic (e.g., "Pakistan Textile")
         if len(words) == 2:
             if words[1] in self.GENERIC_TERMS or words[0] in self.GENERIC_TERMS:
-                logger.debug(f"Noise: Country+Generic pattern '{company_name}'")
+                logger.debug("Noise: Country+Generic pattern '%s'", company_name)
                 return True
         
         # Check for noise keywords
-        noise_patterns = [
-            r"\b(event|summit|conference|review|news|expo|fair|exhibition)\b",
-            r"^(the |a )?(textile|dyeing|finishing|machine)$",
-            r"\d{4}\s*(event|summit|conference)",  # "2024 event"
-        ]
-        
-        for pattern in noise_patterns:
-            if re.search(pattern, name_lower):
-                logger.debug(f"Noise: Pattern match '{pattern}' in '{company_name}'")
+        for pattern in _NOISE_PATTERNS:
+            if pattern.search(name_lower):
+                logger.debug("Noise: Pattern match '%s' in '%s'", pattern.pattern, company_name)
                 return True
         
         # Very short names are suspicious
-        if len(name_lower) < 5 and not re.search(r'\w+\s+(ltd|inc|llc|gmbh|sa|srl)', name_lower):
-            logger.debug(f"Noise: Too short without suffix '{company_name}'")
+        if len(name_lower) < 5 and not _SHORT_SUFFIX_RE.search(name_lower):
+            logger.debug("Noise: Too short without suffix '%s'", company_name)
             return True
         
         return False
@@ -176,19 +202,23 @@ class DataCleaner:
         """
         text = f"{company_name} {context}".lower()
         
-        for indicator in self.NON_CUSTOMER_INDICATORS:
-            if indicator in text:
-                # Exception: "garment" is OK if combined with dyeing/finishing
-                if indicator == "garment" and any(x in text for x in ["dyeing", "finishing", "boyama", "terbiye", "tinturaria"]):
-                    continue
-                # V10.5: "institute" is OK if followed by "of technology" (e.g., IIT)
-                if indicator == "institute" and "technology" in text:
-                    continue
-                # V10.5: "chamber" alone should not filter "reaction chamber" etc.
-                if indicator == "chamber" and "reaction" in text:
-                    continue
-                logger.debug(f"Non-customer indicator '{indicator}' found in: {company_name}")
-                return True
+        if self._nc_automaton is not None:
+            found = (indicator for _, indicator in self._nc_automaton.iter(text))
+        else:
+            found = (indicator for indicator in self.NON_CUSTOMER_INDICATORS if indicator in text)
+        
+        for indicator in found:
+            # Exception: "garment" is OK if combined with dyeing/finishing
+            if indicator == "garment" and any(x in text for x in ["dyeing", "finishing", "boyama", "terbiye", "tinturaria"]):
+                continue
+            # V10.5: "institute" is OK if followed by "of technology" (e.g., IIT)
+            if indicator == "institute" and "technology" in text:
+                continue
+            # V10.5: "chamber" alone should not filter "reaction chamber" etc.
+            if indicator == "chamber" and "reaction" in text:
+                continue
+            logger.debug("Non-customer indicator '%s' found in: %s", indicator, company_name)
+            return True
         
         return False
     
@@ -218,14 +248,14 @@ class DataCleaner:
         domain_lower = domain.lower().strip()
         
         # Remove protocol and path
-        domain_lower = re.sub(r'^https?://', '', domain_lower)
+        domain_lower = _PROTOCOL_RE.sub('', domain_lower)
         domain_lower = domain_lower.split('/')[0]
         
         # Check blocklist
-        for blocked in self.DOMAIN_BLOCKLIST:
-            if blocked in domain_lower:
-                logger.debug(f"Blocked domain: {domain} (matches {blocked})")
-                return False
+        blocked = self._blocklist_re.search(domain_lower)
+        if blocked:
+            logger.debug("Blocked domain: %s (matches %s)", domain, blocked.group(0))
+            return False
         
         return True
     
@@ -270,14 +300,81 @@ class DataCleaner:
                 website = str(website).strip()
             
             if website and not self.validate_domain(website):
-                logger.info(f"Clearing invalid domain for {company_name}: {website}")
+                logger.debug("Clearing invalid domain for %s: %s", company_name, website)
                 lead['website'] = None
                 lead['needs_discovery'] = True
                 lead['invalid_domain_cleared'] = website
             
             cleaned.append(lead)
         
-        logger.info(f"Cleaned {len(leads)} leads: {len(cleaned)} kept, {len(rejected)} rejected")
+        cleared = sum(1 for lead in cleaned if lead.get('invalid_domain_cleared'))
+        logger.info(f"Cleaned {len(leads)} leads: {len(cleaned)} kept, {len(rejected)} rejected, "
+                    f"{cleared} invalid domains cleared")
+        
+        return cleaned, rejected
+    
+    def clean_dataframe(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Vectorized clean_dataset for leads held in a DataFrame
+        
+        Applies the same noise and domain rules as is_noise/validate_domain,
+        but as pandas string operations over whole columns. Company names
+        are resolved exactly as in clean_dataset: falsy 'company_name'
+        values (None, '') fall back to 'company', while NaN is truthy and
+        is checked as the string 'nan'.
+        
+        Args:
+            df: Leads with 'company' or 'company_name', 'website', etc.
+            
+        Returns:
+            Tuple of (cleaned_df, rejected_df)
+        """
+        empty = pd.Series('', index=df.index, dtype=object)
+        company = df['company'].astype(object) if 'company' in df.columns else empty
+        if 'company_name' in df.columns:
+            primary = df['company_name'].astype(object)
+            company = primary.where(primary.map(bool), company)
+        name = company.map(lambda value: str(value).strip() if value else '')
+        name_lower = name.str.lower()
+        words = name_lower.str.split()
+        word_count = words.str.len()
+        generic = self.GENERIC_TERMS
+        
+        noise = (
+            (name.str.len() < 3)
+            | ((word_count == 1) & name_lower.isin(generic))
+            | ((word_count == 2) & (words.str[0].isin(generic) | words.str[1].isin(generic)))
+            | name_lower.str.contains(_NOISE_RE, na=False)
+            | ((name_lower.str.len() < 5) & ~name_lower.str.contains(_SHORT_SUFFIX_RE, na=False))
+        )
+        
+        rejected = df[noise].copy()
+        rejected['rejection_reason'] = 'noise_company_name'
+        cleaned = df[~noise].copy()
+        
+        if 'website' in cleaned.columns and len(cleaned):
+            website = cleaned['website'].fillna('').astype(str).str.strip()
+            host = (website.str.lower()
+                    .str.replace(_PROTOCOL_RE, '', regex=True)
+                    .str.split('/').str[0])
+            invalid = (website != '') & host.str.contains(self._blocklist_re, na=False)
+            
+            if invalid.any():
+                logger.info(f"Clearing {int(invalid.sum())} invalid domains")
+                # Untouched rows stay unset (not False): downstream treats an
+                # explicit False as opting out of discovery
+                if 'needs_discovery' not in cleaned.columns:
+                    cleaned['needs_discovery'] = None
+                if 'invalid_domain_cleared' not in cleaned.columns:
+                    cleaned['invalid_domain_cleared'] = None
+                cleaned['website'] = cleaned['website'].astype(object)
+                cleaned['needs_discovery'] = cleaned['needs_discovery'].astype(object)
+                cleaned['invalid_domain_cleared'] = cleaned['invalid_domain_cleared'].astype(object)
+                cleaned.loc[invalid, 'invalid_domain_cleared'] = website[invalid]
+                cleaned.loc[invalid, 'website'] = None
+                cleaned.loc[invalid, 'needs_discovery'] = True
+        
+        logger.info(f"Cleaned {len(df)} leads: {len(cleaned)} kept, {len(rejected)} rejected")
         
         return cleaned, rejected
     
@@ -295,10 +392,10 @@ class DataCleaner:
             return None
         
         # Remove common separators
-        cleaned = re.sub(r'[\s\-\(\)\.]', '', phone)
+        cleaned = _PHONE_STRIP_RE.sub('', phone)
         
         # Must have at least 7 digits
-        if len(re.findall(r'\d', cleaned)) < 7:
+        if len(_PHONE_DIGIT_RE.findall(cleaned)) < 7:
             return None
         
         return cleaned
@@ -319,9 +416,7 @@ class DataCleaner:
         email = email.lower().strip()
         
         # Basic email pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if re.match(pattern, email):
+        if _EMAIL_RE.match(email):
             return email
         
         return None
@@ -1,11 +1,24 @@
-import difflib
 import math
 import ast
+from functools import lru_cache
 from urllib.parse import urlparse
 
+import numpy as np
+from rapidfuzz import fuzz, process
+
 from src.processors.entity_extractor import EntityExtractor
 from src.utils.logger import get_logger
 
+try:
+    import tldextract
+    # Bundled public-suffix snapshot only (no network fetch, no disk cache);
+    # private suffixes keep acme.wixsite.com and foo.wixsite.com apart
+    _TLD_EXTRACT = tldextract.TLDExtract(
+        suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True
+    )
+except ImportError:
+    _TLD_EXTRACT = None
+
 logger = get_logger(__name__)
 
 # GPT Fix #3: Source priority for merge (higher = more trusted)
@@ -23,17 +36,52 @@ SOURCE_PRIORITY = {
     "comtrade": 40,        # Trade data
 }
 
+# Rows per rapidfuzz score matrix in name dedupe (uint8 scores: chunk x columns bytes)
+_PAIR_ROW_CHUNK = 512
+
+
+@lru_cache(maxsize=50_000)
+def _url_domain(url):
+    """Grouping domain of ``url``, memoized.
+
+    The registered domain (www.acme.com.tr, shop.acme.com.tr -> acme.com.tr)
+    when tldextract is installed, otherwise the lowercased netloc (or the
+    whole URL if it has none) without a leading ``www.``.
+    """
+    parsed = urlparse(url)
+    netloc = parsed.netloc.lower() or url.lower()
+    if _TLD_EXTRACT is not None:
+        extracted = _TLD_EXTRACT(netloc)
+        if extracted.domain and extracted.suffix:
+            return f"{extracted.domain}.{extracted.suffix}"
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+def _find(parent, i):
+    """Union-find root of ``i`` with path halving."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent, i, j):
+    """Join the sets of ``i`` and ``j``; the smaller index stays the root."""
+    root_i, root_j = _find(parent, i), _find(parent, j)
+    if root_i != root_j:
+        parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+# List-valued fields unioned when records are merged
+MERGE_LIST_FIELDS = ("emails", "phones", "websites", "country_mentions")
+
 
 class LeadDedupe:
     def __init__(self, similarity_threshold=0.92):
         self.similarity_threshold = similarity_threshold
         self.extractor = EntityExtractor()
-        try:
-            from rapidfuzz import fuzz  # type: ignore
-
-            self._fuzz = fuzz
-        except Exception:
-            self._fuzz = None
+        # Memoized by EntityExtractor; names recur across the dedupe passes
+        self._normalize = self.extractor.normalize_company
 
     def dedupe(self, leads):
         if not leads:
@@ -60,41 +108,35 @@ class LeadDedupe:
 
         # Phase 1: Merge by domain
         for domain, items in by_domain.items():
-            kept = self._select_best_source(items)
-            for item in items:
-                if item is not kept:
-                    audit.append(
-                        {
-                            "kept_company": kept.get("company", ""),
-                            "merged_company": item.get("company", ""),
-                            "reason": f"same_domain:{domain}",
-                        }
-                    )
-                    kept = self._merge_records(kept, item)
-            merged.append(kept)
+            merged.append(self._merge_group(items, f"same_domain:{domain}", audit))
 
         # Phase 2: Merge by normalized_company + country (NEW)
         for norm_key, items in by_norm_country.items():
-            kept = self._select_best_source(items)
-            for item in items:
-                if item is not kept:
-                    audit.append(
-                        {
-                            "kept_company": kept.get("company", ""),
-                            "merged_company": item.get("company", ""),
-                            "reason": f"norm_country:{norm_key}",
-                        }
-                    )
-                    kept = self._merge_records(kept, item)
-            merged.append(kept)
+            merged.append(self._merge_group(items, f"norm_country:{norm_key}", audit))
 
         # Phase 3: Fuzzy name matching for leftovers
         merged.extend(self._dedupe_by_name(leftovers, audit))
         return merged, audit
 
+    def _merge_group(self, items, reason, audit):
+        """Fold a group into a copy of its most trusted record."""
+        best = self._select_best_source(items)
+        others = [item for item in items if item is not best]
+        for item in others:
+            audit.append(
+                {
+                    "kept_company": best.get("company", ""),
+                    "merged_company": item.get("company", ""),
+                    "reason": reason,
+                }
+            )
+        if not others:
+            return best
+        return self._fold(dict(best), others)
+
     def _get_norm_country_key(self, lead):
         """GPT Fix #3: Create normalized_company + country key for grouping."""
-        norm = lead.get("normalized_company") or self.extractor.normalize_company(lead.get("company", ""))
+        norm = lead.get("normalized_company") or self._normalize(lead.get("company", ""))
         country = lead.get("country")
         # Handle NaN/float values
         if country is None or (isinstance(country, float) and (math.isnan(country) or str(country) == "nan")):
@@ -113,50 +155,96 @@ class LeadDedupe:
         return max(items, key=get_priority)
 
     def _dedupe_by_name(self, leads, audit):
-        merged = []
-        seen = set()
-        for lead in leads:
-            if id(lead) in seen:
-                continue
-            kept = lead
-            seen.add(id(lead))
-            for other in leads:
-                if id(other) in seen:
-                    continue
-                if self._is_similar_name(lead.get("company", ""), other.get("company", "")):
-                    audit.append(
-                        {
-                            "kept_company": kept.get("company", ""),
-                            "merged_company": other.get("company", ""),
-                            "reason": "name_similarity",
-                        }
-                    )
-                    kept = self._merge_records(kept, other)
-                    seen.add(id(other))
-            merged.append(kept)
-        return merged
+        """Merge leads whose normalized names are similar, transitively.
+
+        Similar pairs are edges of a graph and every connected component is
+        merged into its most trusted record, so A~B and B~C end up together
+        even when A and C alone fall below the threshold.
+        """
+        names = [self._normalize(lead.get("company", "")) for lead in leads]
+        parent = list(range(len(leads)))
+        for i, js in self._similar_pairs(names).items():
+            for j in js:
+                _union(parent, i, j)
+
+        components = {}
+        for i, lead in enumerate(leads):
+            components.setdefault(_find(parent, i), []).append(lead)
+        return [self._merge_group(items, "name_similarity", audit) for items in components.values()]
+
+    def _similar_pairs(self, names):
+        """Map each index to the later indices whose normalized name is similar.
+
+        fuzz.ratio is bounded by 2*min(len)/(len_a+len_b), so names are blocked
+        by length and each block is scored only against the lengths that can
+        still reach the cutoff, as rapidfuzz matrices computed in C. Rows go
+        in chunks of _PAIR_ROW_CHUNK with uint8 scores, so a matrix stays at
+        chunk x columns bytes however large the lead set.
+        """
+        by_length = {}
+        for i, name in enumerate(names):
+            if name:
+                by_length.setdefault(len(name), []).append(i)
+        lengths = sorted(by_length)
+        cutoff = int(self.similarity_threshold * 100)
+
+        pairs = {}
+        for length in lengths:
+            max_length = length * (200 - cutoff) / cutoff
+            cols = [j for other in lengths if length <= other <= max_length for j in by_length[other]]
+            col_names = [names[j] for j in cols]
+            block = by_length[length]
+            for start in range(0, len(block), _PAIR_ROW_CHUNK):
+                rows = block[start : start + _PAIR_ROW_CHUNK]
+                scores = process.cdist(
+                    [names[i] for i in rows],
+                    col_names,
+                    scorer=fuzz.ratio,
+                    score_cutoff=cutoff,
+                    dtype=np.uint8,
+                    workers=-1,
+                )
+                for r, c in zip(*scores.nonzero()):
+                    i, j = rows[r], cols[c]
+                    if i != j:
+                        pairs.setdefault(min(i, j), set()).add(max(i, j))
+        return {i: sorted(js) for i, js in pairs.items()}
 
     def _is_similar_name(self, a, b):
-        norm_a = self.extractor.normalize_company(a)
-        norm_b = self.extractor.normalize_company(b)
+        return self._is_similar_norm(self._normalize(a), self._normalize(b))
+
+    def _is_similar_norm(self, norm_a, norm_b):
         if not norm_a or not norm_b:
             return False
         if norm_a == norm_b:
             return True
-        if self._fuzz:
-            return self._fuzz.ratio(norm_a, norm_b) >= int(self.similarity_threshold * 100)
-        ratio = difflib.SequenceMatcher(None, norm_a, norm_b).ratio()
-        return ratio >= self.similarity_threshold
+        cutoff = int(self.similarity_threshold * 100)
+        # ratio <= 2*min(len)/(len_a+len_b): reject unreachable pairs in O(1)
+        len_a, len_b = len(norm_a), len(norm_b)
+        if 200 * min(len_a, len_b) < cutoff * (len_a + len_b):
+            return False
+        # With score_cutoff rapidfuzz stops as soon as the cutoff is unreachable (returns 0)
+        return fuzz.ratio(norm_a, norm_b, score_cutoff=cutoff) >= cutoff
 
     def _merge_records(self, kept, other):
-        merged = dict(kept)
-        for field in ["emails", "phones", "websites", "country_mentions"]:
-            merged[field] = sorted(
-                set(self._as_list(kept.get(field)) + self._as_list(other.get(field)))
-            )
-        merged["score"] = max(kept.get("score", 0), other.get("score", 0))
-        merged["context"] = kept.get("context") or other.get("context")
-        return merged
+        return self._fold(dict(kept), [other])
+
+    def _fold(self, kept, others):
+        """Merge ``others`` into ``kept`` in place.
+
+        List fields are unioned as sets across all records and sorted once at
+        the end, which gives the same result as merging pairwise with
+        sorted(set(a + b)) but without re-sorting after every record.
+        """
+        pools = {field: set(self._as_list(kept.get(field))) for field in MERGE_LIST_FIELDS}
+        for other in others:
+            for field in MERGE_LIST_FIELDS:
+                pools[field].update(self._as_list(other.get(field)))
+            kept["score"] = max(kept.get("score", 0), other.get("score", 0))
+            kept["context"] = kept.get("context") or other.get("context")
+        for field in MERGE_LIST_FIELDS:
+            kept[field] = sorted(pools[field])
+        return kept
 
     def _as_list(self, value):
         if value is None:
@@ -182,5 +270,4 @@ class LeadDedupe:
     def _domain(self, url):
         if not url or not isinstance(url, str):
             return ""
-        parsed = urlparse(url)
-        return parsed.netloc.lower() or url.lower()
+        return _url_domain(url)
@@ -11,17 +11,31 @@ Sonsuz Doğrulama Döngüsü (Deep Validation Loop):
 Bu modül her lead'i derinlemesine doğrular ve satışa hazır hale getirir.
 """
 
+import asyncio
+import hashlib
 import os
 import re
+import threading
 import time
 import warnings
 import requests
 import phonenumbers
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 from datetime import datetime
-from bs4 import BeautifulSoup
+import lxml.html
+
+try:
+    import aiohttp
+except ImportError:  # async batch path is optional
+    aiohttp = None
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Suppress SSL warnings since we're using verify=False for speed
 import urllib3
@@ -33,9 +47,6 @@ from src.utils.http_client import HttpClient
 
 logger = get_logger(__name__)
 
-# Thread pool for hard timeouts
-_executor = ThreadPoolExecutor(max_workers=2)
-
 
 # P0 Fix: Email blocklist for quality filtering
 EMAIL_BLOCKLIST_PREFIXES = [
@@ -49,6 +60,12 @@ EMAIL_BLOCKLIST_DOMAINS = [
     "wixpress.com", "placeholder.com", "domain.com",
 ]
 
+# Blocklists in single-call form (substring match on the address / local-part prefix)
+_EMAIL_BLOCKLIST_DOMAIN_RE = re.compile("|".join(re.escape(d) for d in EMAIL_BLOCKLIST_DOMAINS))
+_EMAIL_BLOCKLIST_PREFIXES = tuple(EMAIL_BLOCKLIST_PREFIXES)
+# Asset names that look like addresses (logo@2x.png, icon@3x.svg, ...)
+_EMAIL_ASSET_EXTENSIONS = (".png", ".jpg", ".gif", ".css", ".js", ".svg", ".ico", ".woff")
+
 
 # OEM Brands for evidence detection
 OEM_BRANDS = [
@@ -72,6 +89,32 @@ FINISHING_KEYWORDS = [
     "rama", "ramas", "tintorería", "acabado", "blanqueo", "teñido",
 ]
 
+# De-duplicated, order-preserving scan lists (built once at import)
+_OEM_TERMS = tuple(dict.fromkeys(OEM_BRANDS))
+_FINISHING_TERMS = tuple(dict.fromkeys(FINISHING_KEYWORDS))
+
+
+
+
+def _signals_automaton():
+    """
+    One Aho-Corasick automaton over finishing keywords and OEM brands, so a
+    single pass reports every term (None without pyahocorasick).
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in _FINISHING_TERMS + _OEM_TERMS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNALS_AUTOMATON = _signals_automaton()
+
+# Country-code TLDs commonly registered as generic names (no region hint)
+GENERIC_CCTLDS = {"ai", "cc", "co", "fm", "gg", "io", "ly", "me", "to", "tv", "ws"}
+
 # Contact page indicators
 CONTACT_PAGE_INDICATORS = [
     "contact", "contato", "contacto", "iletisim", "iletişim",
@@ -83,6 +126,64 @@ EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
 
 # Phone regex (international format)
 PHONE_REGEX = re.compile(r'[\+\d\(\)\s\-]{8,20}')
+# No valid number is shorter than 4 digits (Tokelau fixed lines); cheaper than the matcher
+_MIN_PHONE_DIGITS_RE = re.compile(r"\d(?:\D*\d){3}")
+
+# Request headers (homepage check / sub-page fetch)
+HOMEPAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+PAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+}
+
+# Response bodies are streamed and cut off here (bytes), so a huge or endless
+# response cannot hold a lead's memory or the text scans hostage
+MAX_PAGE_BYTES = 2_000_000
+# Sub-pages are kept to 500K characters, so their stream stops much earlier
+MAX_SUBPAGE_BYTES = 512 * 1024
+# Sub-pages with another declared Content-Type (PDF, images, ...) are not read
+TEXT_CONTENT_TYPES = ("text/", "application/xhtml", "application/xml")
+
+
+def _build_session() -> requests.Session:
+    """
+    Process-wide keep-alive session: sub-pages (and later validators) reuse
+    the connection and TLS session opened for a site's homepage.
+    """
+    session = requests.Session()
+    session.verify = False  # Skip SSL for speed - we're scanning content not transacting
+    # The adapter's urllib3 PoolManager keeps one pool per host: many hosts
+    # stay warm across a batch, each with the few connections a site needs
+    adapter = HTTPAdapter(pool_connections=256, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_session()
+
+_now_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Local time in ISO format, formatted at most once per second."""
+    global _now_iso_cache
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_iso_cache[1]
+
+
+# lxml rejects str input carrying an encoding declaration (common on XHTML pages)
+_XML_DECLARATION_RE = re.compile(r"\A[\s\ufeff]*<\?xml[^>]*\?>")
+
+
+def _html_document(html: str):
+    """lxml document for a page's HTML, minus any leading <?xml ...?> declaration."""
+    return lxml.html.fromstring(_XML_DECLARATION_RE.sub("", html))
 
 
 class DeepValidator:
@@ -96,17 +197,34 @@ class DeepValidator:
     4. Tier classification
     """
     
+    # Batch: leads validated concurrently (async) / min lead spacing per host (seconds)
+    CONCURRENCY = 20
+    HOST_INTERVAL = 0.3
+    # Fetched pages are reused from disk for this long (seconds); the oldest
+    # pages are pruned once the cache directory grows past CACHE_MAX_BYTES
+    CACHE_TTL = 7 * 24 * 3600
+    CACHE_MAX_BYTES = 500 * 1024 * 1024
+    
     def __init__(
         self,
         http_client: Optional[HttpClient] = None,
         max_pages_per_site: int = 5,
         timeout: int = 10,
         max_lead_seconds: int = 60,
+        cache_dir: Optional[str] = "data/raw/deep_validation",
     ):
         self.http = http_client or HttpClient()
         self.max_pages = max_pages_per_site
         self.timeout = timeout
         self.max_lead_seconds = max_lead_seconds
+        self._host_next: Dict[str, float] = {}
+        
+        # Page cache (None disables): reruns over overlapping leads skip the network
+        self.cache_dir = cache_dir
+        self.use_cache = cache_dir is not None
+        
+        # Keep-alive pool for the sequential path, shared by all validators
+        self._session = _SHARED_SESSION
         
         # Stats
         self.stats = {
@@ -127,17 +245,86 @@ class DeepValidator:
         
         Returns enriched lead with validation results.
         """
-        company = lead.get("company", "")
+        website, result = self._start_validation(lead)
+        start_ts = time.monotonic()
+        
+        if not website:
+            result["validation_status"] = "no_website"
+            lead.update(result)
+            return lead
+        
+        # Step 1: Check website accessibility (P0: now returns fail_reason)
+        is_accessible, homepage_html, fail_reason = self._check_website(website)
+        if not self._record_access(result, is_accessible, fail_reason):
+            lead.update(result)
+            return lead
+        
+        # Step 2: Parse the homepage once for its links and its text
+        homepage = self._parse_html(homepage_html)
+        additional_pages = self._find_key_pages(website, homepage)
+        page_texts = [self._page_text(homepage)]
+        pages_scanned = 1
+        
+        # Step 3: Scan additional pages
+        for page_url in additional_pages[:self.max_pages - 1]:
+            if time.monotonic() - start_ts > self.max_lead_seconds:
+                result["validation_status"] = "lead_timeout"
+                result["fail_reason"] = "lead_timeout"
+                lead.update(result)
+                return lead
+            page_html = self._fetch_page(page_url)
+            if page_html:
+                page_texts.append(self._page_text(page_html))
+                pages_scanned += 1
+        
+        self._analyze(result, " ".join(page_texts), pages_scanned, self._phone_region(website))
+        lead.update(result)
+        return lead
+    
+    async def _avalidate_lead(self, session, lead: Dict) -> Dict:
+        """validate_lead over a shared aiohttp session (same steps and result fields)."""
+        website, result = self._start_validation(lead)
+        start_ts = time.monotonic()
+        
+        if not website:
+            result["validation_status"] = "no_website"
+            lead.update(result)
+            return lead
+        
+        is_accessible, homepage_html, fail_reason = await self._acheck_website(session, website)
+        if not self._record_access(result, is_accessible, fail_reason):
+            lead.update(result)
+            return lead
+        
+        homepage = self._parse_html(homepage_html)
+        additional_pages = self._find_key_pages(website, homepage)
+        page_texts = [self._page_text(homepage)]
+        pages_scanned = 1
+        
+        for page_url in additional_pages[:self.max_pages - 1]:
+            if time.monotonic() - start_ts > self.max_lead_seconds:
+                result["validation_status"] = "lead_timeout"
+                result["fail_reason"] = "lead_timeout"
+                lead.update(result)
+                return lead
+            page_html = await self._afetch_page(session, page_url)
+            if page_html:
+                page_texts.append(self._page_text(page_html))
+                pages_scanned += 1
+        
+        self._analyze(result, " ".join(page_texts), pages_scanned, self._phone_region(website))
+        lead.update(result)
+        return lead
+    
+    def _start_validation(self, lead: Dict) -> Tuple[str, Dict]:
+        """Count the lead and build its empty validation result."""
         website = lead.get("website", "")
         
         # Guard against NaN values from pandas
         if not isinstance(website, str):
             website = ""
-        if not isinstance(company, str):
-            company = str(company) if company else ""
         
         self.stats["total_validated"] += 1
-        start_ts = time.monotonic()
         
         result = {
             "validation_status": "pending",
@@ -149,17 +336,13 @@ class DeepValidator:
             "phones_extracted": [],
             "pages_scanned": 0,
             "tier": 3,  # Default to lowest
-            "validated_at": datetime.now().isoformat(),
+            "validated_at": _now_iso(),
             "fail_reason": "",  # P0: Track why validation failed
         }
-        
-        if not website:
-            result["validation_status"] = "no_website"
-            lead.update(result)
-            return lead
-        
-        # Step 1: Check website accessibility (P0: now returns fail_reason)
-        is_accessible, homepage_html, fail_reason = self._check_website(website)
+        return website, result
+    
+    def _record_access(self, result: Dict, is_accessible: bool, fail_reason: str) -> bool:
+        """Store the website check outcome; False if validation stops here."""
         result["website_accessible"] = is_accessible
         result["fail_reason"] = fail_reason
         
@@ -167,34 +350,18 @@ class DeepValidator:
             result["validation_status"] = f"website_inaccessible:{fail_reason}"
             # P0: Track fail reasons in stats
             if fail_reason:
-                self.stats["fail_reasons"][fail_reason] = self.stats["fail_reasons"].get(fail_reason, 0) + 1
-            lead.update(result)
-            return lead
+                self._count_fail(fail_reason)
+            return False
         
         self.stats["websites_accessible"] += 1
-        
-        # Step 2: Scan homepage for keywords
-        all_text = homepage_html
-        pages_scanned = 1
-        
-        # Step 3: Find and scan additional pages
-        additional_pages = self._find_key_pages(website, homepage_html)
-        for page_url in additional_pages[:self.max_pages - 1]:
-            if time.monotonic() - start_ts > self.max_lead_seconds:
-                result["validation_status"] = "lead_timeout"
-                result["fail_reason"] = "lead_timeout"
-                lead.update(result)
-                return lead
-            page_html = self._fetch_page(page_url)
-            if page_html:
-                all_text += " " + page_html
-                pages_scanned += 1
-        
+        return True
+    
+    def _analyze(self, result: Dict, all_text: str, pages_scanned: int, region: Optional[str] = None) -> None:
+        """Keyword/contact extraction and tiering over the scanned pages."""
         result["pages_scanned"] = pages_scanned
         
         # Step 4: Extract keywords
-        finishing_signals = self._extract_finishing_signals(all_text)
-        oem_signals = self._extract_oem_signals(all_text)
+        finishing_signals, oem_signals = self._extract_signals(all_text)
         
         result["finishing_signals"] = finishing_signals
         result["oem_signals"] = oem_signals
@@ -205,7 +372,7 @@ class DeepValidator:
         
         # Step 5: Extract contacts
         emails = self._extract_emails(all_text)
-        phones = self._extract_phones(all_text)
+        phones = self._extract_phones(all_text, region, limit=3)
         
         result["emails_extracted"] = emails[:5]  # Max 5
         result["phones_extracted"] = phones[:3]  # Max 3
@@ -226,9 +393,43 @@ class DeepValidator:
             self.stats["tier_2"] += 1
         else:
             self.stats["tier_3"] += 1
-        
-        lead.update(result)
-        return lead
+    
+    def _count_fail(self, reason: str) -> None:
+        fail_reasons = self.stats.setdefault("fail_reasons", {})
+        fail_reasons[reason] = fail_reasons.get(reason, 0) + 1
+    
+    @staticmethod
+    def _homepage_urls(url: str) -> List[str]:
+        """HTTPS first, then HTTP fallback (scheme added if missing)."""
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+        return [url, url.replace("https://", "http://")]
+    
+    def _homepage_outcome(self, status: int, text: str) -> Optional[Tuple[bool, str, str]]:
+        """Interpret a homepage response; None means try the next URL."""
+        if status == 200:
+            # Check for CloudFlare challenge
+            if len(text) < 2000 and "cf-ray" in text.lower():
+                self._count_fail("cloudflare")
+                return None  # Try HTTP fallback
+            return True, text, ""
+        elif status == 403:
+            self._count_fail("403_forbidden")
+        elif status == 404:
+            return False, "", "404_not_found"
+        return None
+    
+    def _connection_fail(self, error: Exception) -> Tuple[bool, str, str]:
+        error_str = str(error).lower()
+        os_error = getattr(error, "os_error", None)  # aiohttp connector errors
+        if "reset" in error_str or isinstance(os_error, ConnectionResetError):
+            reason = "connection_reset"
+        elif "refused" in error_str or isinstance(os_error, ConnectionRefusedError):
+            reason = "connection_refused"
+        else:
+            reason = "connection_error"
+        self._count_fail(reason)
+        return False, "", reason
     
     def _check_website(self, url: str) -> Tuple[bool, str, str]:
         """
@@ -242,62 +443,39 @@ class DeepValidator:
         if not url or not isinstance(url, str):
             return False, "", "invalid_url"
         
-        original_url = url
-        
-        # Ensure URL has scheme
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+        cached = self._cache_get(url)
+        if cached is not None:
+            return True, cached, ""
         
         # Try HTTPS first, then HTTP fallback
-        for attempt_url in [url, url.replace("https://", "http://")]:
+        for attempt_url in self._homepage_urls(url):
             try:
-                response = requests.get(
+                with self._session.get(
                     attempt_url,
                     timeout=(3, 10),  # Aggressive: 3s connect, 10s read (was 5, self.timeout)
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                        "Accept-Language": "en-US,en;q=0.5",
-                    },
+                    headers=HOMEPAGE_HEADERS,
                     allow_redirects=True,
-                    verify=False,  # Skip SSL for speed - we're scanning content not transacting
-                )
-                
-                if response.status_code == 200:
-                    # Check for CloudFlare challenge
-                    if "cf-ray" in response.text.lower() and len(response.text) < 2000:
-                        self.stats.setdefault("fail_reasons", {})
-                        self.stats["fail_reasons"]["cloudflare"] = self.stats["fail_reasons"].get("cloudflare", 0) + 1
-                        continue  # Try HTTP fallback
-                    return True, response.text, ""
-                elif response.status_code == 403:
-                    self.stats.setdefault("fail_reasons", {})
-                    self.stats["fail_reasons"]["403_forbidden"] = self.stats["fail_reasons"].get("403_forbidden", 0) + 1
-                elif response.status_code == 404:
-                    return False, "", "404_not_found"
+                    stream=True,
+                ) as response:
+                    status = response.status_code
+                    text = self._read_body(response) if status == 200 else ""
+                outcome = self._homepage_outcome(status, text)
+                if outcome:
+                    if outcome[0]:
+                        self._cache_put(url, outcome[1])
+                    return outcome
                     
             except requests.exceptions.SSLError as e:
                 logger.debug(f"SSL error for {attempt_url}: {e}")
-                self.stats.setdefault("fail_reasons", {})
-                self.stats["fail_reasons"]["ssl_error"] = self.stats["fail_reasons"].get("ssl_error", 0) + 1
+                self._count_fail("ssl_error")
                 continue  # Try HTTP fallback
                 
             except requests.exceptions.Timeout:
-                self.stats.setdefault("fail_reasons", {})
-                self.stats["fail_reasons"]["timeout"] = self.stats["fail_reasons"].get("timeout", 0) + 1
+                self._count_fail("timeout")
                 return False, "", "timeout"
                 
             except requests.exceptions.ConnectionError as e:
-                error_str = str(e).lower()
-                if "reset" in error_str:
-                    reason = "connection_reset"
-                elif "refused" in error_str:
-                    reason = "connection_refused"
-                else:
-                    reason = "connection_error"
-                self.stats.setdefault("fail_reasons", {})
-                self.stats["fail_reasons"][reason] = self.stats["fail_reasons"].get(reason, 0) + 1
-                return False, "", reason
+                return self._connection_fail(e)
                 
             except Exception as e:
                 logger.debug(f"Website check failed for {attempt_url}: {e}")
@@ -305,21 +483,67 @@ class DeepValidator:
         
         return False, "", "all_attempts_failed"
     
+    async def _acheck_website(self, session, url: str) -> Tuple[bool, str, str]:
+        """Async _check_website (same fallbacks and fail reasons)."""
+        if not url or not isinstance(url, str):
+            return False, "", "invalid_url"
+        
+        cached = self._cache_get(url)
+        if cached is not None:
+            return True, cached, ""
+        
+        for attempt_url in self._homepage_urls(url):
+            try:
+                async with session.get(
+                    attempt_url,
+                    timeout=aiohttp.ClientTimeout(sock_connect=3, sock_read=10),
+                    headers=HOMEPAGE_HEADERS,
+                    allow_redirects=True,
+                ) as response:
+                    status = response.status
+                    text = await self._aread_body(response) if status == 200 else ""
+                outcome = self._homepage_outcome(status, text)
+                if outcome:
+                    if outcome[0]:
+                        self._cache_put(url, outcome[1])
+                    return outcome
+            
+            except aiohttp.ClientSSLError as e:
+                logger.debug(f"SSL error for {attempt_url}: {e}")
+                self._count_fail("ssl_error")
+                continue  # Try HTTP fallback
+            
+            except asyncio.TimeoutError:
+                self._count_fail("timeout")
+                return False, "", "timeout"
+            
+            except aiohttp.ClientConnectionError as e:
+                return self._connection_fail(e)
+            
+            except Exception as e:
+                logger.debug(f"Website check failed for {attempt_url}: {e}")
+                return False, "", "unknown_error"
+        
+        return False, "", "all_attempts_failed"
+    
     def _fetch_page(self, url: str) -> Optional[str]:
         """Fetch a single page with strict timeout."""
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(
+            with self._session.get(
                 url,
                 timeout=(3, 8),  # Aggressive: 3s connect, 8s read (was 5, 10)
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                },
-                verify=False,  # Skip SSL verification for speed - we're just scanning content
+                headers=PAGE_HEADERS,
                 allow_redirects=True,
-            )
-            if response.status_code == 200:
-                # Limit content size to prevent memory issues
-                return response.text[:500000]  # Max 500KB
+                stream=True,
+            ) as response:
+                if response.status_code == 200 and self._is_text(response.headers.get("Content-Type")):
+                    # Limit content size to prevent memory issues
+                    text = self._read_body(response, MAX_SUBPAGE_BYTES)[:500000]  # Max 500KB
+                    self._cache_put(url, text)
+                    return text
         except requests.exceptions.Timeout:
             logger.debug(f"Page fetch timeout: {url}")
         except requests.exceptions.SSLError:
@@ -328,86 +552,297 @@ class DeepValidator:
             logger.debug(f"Page fetch error: {url} - {e}")
         return None
     
-    def _find_key_pages(self, base_url: str, html: str) -> List[str]:
-        """Find contact, about, and production pages."""
+    async def _afetch_page(self, session, url: str) -> Optional[str]:
+        """Async _fetch_page."""
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
+        try:
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(sock_connect=3, sock_read=8),
+                headers=PAGE_HEADERS,
+                allow_redirects=True,
+            ) as response:
+                if response.status == 200 and self._is_text(response.headers.get("Content-Type")):
+                    text = (await self._aread_body(response, MAX_SUBPAGE_BYTES))[:500000]  # Max 500KB
+                    self._cache_put(url, text)
+                    return text
+        except asyncio.TimeoutError:
+            logger.debug(f"Page fetch timeout: {url}")
+        except aiohttp.ClientSSLError:
+            logger.debug(f"Page fetch SSL error: {url}")
+        except Exception as e:
+            logger.debug(f"Page fetch error: {url} - {e}")
+        return None
+    
+    def _cache_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.html")
+    
+    def _cache_get(self, url: str) -> Optional[str]:
+        """Cached body of a successful fetch of url, if younger than CACHE_TTL."""
+        if not self.use_cache or not self.cache_dir:
+            return None
+        path = self._cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.CACHE_TTL:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _cache_put(self, url: str, text: str) -> None:
+        if not self.use_cache or not self.cache_dir:
+            return
+        path = self._cache_path(url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial page
+            tmp_path = f"{path}.{os.getpid()}.{id(text)}.tmp"
+            with open(tmp_path, "w", encoding="utf-8", errors="replace") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Page cache write failed for {url}: {e}")
+    
+    def _prune_cache(self) -> None:
+        """
+        Delete expired pages (and stale temp files), then the oldest pages
+        until the cache fits CACHE_MAX_BYTES; run once per batch.
+        """
+        if not self.use_cache or not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        now = time.time()
+        pages = []  # (mtime, size, path) of pages that are kept
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file() or not entry.name.endswith((".html", ".tmp")):
+                        continue
+                    stat = entry.stat()
+                    if now - stat.st_mtime > self.CACHE_TTL or (
+                        entry.name.endswith(".tmp") and now - stat.st_mtime > 3600
+                    ):
+                        os.remove(entry.path)
+                        removed += 1
+                    elif entry.name.endswith(".html"):
+                        pages.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in pages)
+            for _, size, path in sorted(pages):
+                if total <= self.CACHE_MAX_BYTES:
+                    break
+                os.remove(path)
+                total -= size
+                removed += 1
+        except OSError as e:
+            logger.debug(f"Page cache prune failed: {e}")
+        if removed:
+            logger.info(f"Page cache: pruned {removed} files from {self.cache_dir}")
+    
+    @staticmethod
+    def _is_text(content_type: Optional[str]) -> bool:
+        """True unless the response declares a non-text Content-Type."""
+        return not content_type or content_type.lower().startswith(TEXT_CONTENT_TYPES)
+    
+    @staticmethod
+    def _decode(body: bytes, encoding: Optional[str]) -> str:
+        try:
+            return body.decode(encoding or "utf-8", errors="replace")
+        except LookupError:  # unknown charset in the Content-Type header
+            return body.decode("utf-8", errors="replace")
+    
+    def _read_body(self, response, limit: int = MAX_PAGE_BYTES) -> str:
+        """Text of a streamed requests response, read up to limit bytes."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+        return self._decode(b"".join(chunks)[:limit], response.encoding)
+    
+    async def _aread_body(self, response, limit: int = MAX_PAGE_BYTES) -> str:
+        """Async _read_body for an aiohttp response."""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body += chunk
+            if len(body) >= limit:
+                break
+        return self._decode(bytes(body[:limit]), response.charset)
+    
+    def _host_delay(self, website) -> float:
+        """
+        Reserve the next start slot on the website's host; returns seconds to wait.
+        
+        Lead starts on the same host are spaced by HOST_INTERVAL (politeness is
+        per host), so leads on different hosts never wait for each other.
+        """
+        if not website or not isinstance(website, str):
+            return 0.0
+        host = urlparse(self._homepage_urls(website)[0]).netloc.lower()
+        now = time.monotonic()
+        slot = max(now, self._host_next.get(host, 0.0))
+        self._host_next[host] = slot + self.HOST_INTERVAL
+        return slot - now
+    
+    def _host_wait(self, website) -> None:
+        delay = self._host_delay(website)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def _ahost_wait(self, website) -> None:
+        delay = self._host_delay(website)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _parse_html(html: str):
+        """Parsed lxml document, or the HTML itself if it cannot be parsed."""
+        try:
+            return _html_document(html)
+        except Exception as e:
+            logger.debug(f"Error parsing page: {e}")
+            return html
+    
+    def _find_key_pages(self, base_url: str, html) -> List[str]:
+        """
+        Find contact, about, and production pages (same site, canonical URLs).
+        
+        html may be a document from _parse_html; only <a href> elements are read.
+        """
         key_pages = []
+        base_url = self._homepage_urls(base_url)[0]
+        base_parts = urlsplit(base_url)
+        site = self._site_host(base_parts.netloc)
+        seen = {(base_parts.path.rstrip("/"), base_parts.query)}  # homepage is already scanned
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            links = soup.find_all("a", href=True)
+            doc = _html_document(html) if isinstance(html, str) else html
+            links = doc.xpath("//a[@href]")
             
             for link in links:
                 href = link.get("href", "")
-                text = link.get_text().lower().strip()
+                text = link.text_content().lower().strip()
                 
                 # Check for contact/about page indicators
                 is_key_page = any(ind in text or ind in href.lower() 
                                  for ind in CONTACT_PAGE_INDICATORS)
                 
                 if is_key_page:
-                    # Resolve relative URLs
-                    full_url = urljoin(base_url, href)
-                    if full_url not in key_pages:
-                        key_pages.append(full_url)
+                    # Resolve relative URLs; skip off-site links (social, mailto:, ...)
+                    parts = urlsplit(urljoin(base_url, href))
+                    if parts.scheme not in ("http", "https") or self._site_host(parts.netloc) != site:
+                        continue
+                    # /contact, /contact/, /contact#form and www./bare host are one
+                    # page; the first form seen is fetched (without its fragment)
+                    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+                    page_key = (parts.path.rstrip("/"), query)
+                    if page_key in seen:
+                        continue
+                    seen.add(page_key)
+                    key_pages.append(urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", query, "")))
             
         except Exception as e:
             logger.debug(f"Error finding key pages: {e}")
         
         return key_pages[:5]
     
-    def _extract_finishing_signals(self, text: str) -> List[str]:
-        """Extract finishing/stenter keywords from text."""
-        if not isinstance(text, str):
-            return []
-        signals = []
-        text_lower = text.lower()
+    @staticmethod
+    def _site_host(netloc: str) -> str:
+        """Host used for same-site checks (case and a leading www. ignored)."""
+        host = netloc.lower()
+        return host[4:] if host.startswith("www.") else host
+    
+    def _page_text(self, html) -> str:
+        """
+        Visible text of a page, parsed once for all extractors.
         
-        for keyword in FINISHING_KEYWORDS:
-            if keyword in text_lower:
-                if keyword not in signals:
-                    signals.append(keyword)
+        Script/style/svg bodies are dropped; mailto:/tel: targets and meta
+        description/keywords are appended since they are not visible text.
+        A document from _parse_html is accepted too (and modified in place,
+        so read its links first).
+        """
+        try:
+            doc = _html_document(html) if isinstance(html, str) else html
+            for element in doc.xpath("//script | //style | //noscript | //svg"):
+                element.drop_tree()
+            extras = doc.xpath(
+                "//a/@href[starts-with(., 'mailto:') or starts-with(., 'tel:')]"
+                " | //meta[@name='description' or @name='keywords']/@content"
+            )
+        except Exception as e:
+            logger.debug(f"Error extracting page text: {e}")
+            return html
         
-        return signals
+        parts = list(doc.itertext())
+        for value in extras:
+            if value.startswith(("mailto:", "tel:")):
+                value = unquote(value.split(":", 1)[1].split("?", 1)[0])
+            parts.append(value)
+        return " ".join(parts)
     
-    def _extract_oem_signals(self, text: str) -> List[str]:
-        """Extract OEM brand mentions from text."""
+    def _extract_signals(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        Finishing keywords and OEM brands in text, each in list order.
+        
+        Case-insensitive substring matches from one scan of the lowercased text.
+        """
         if not isinstance(text, str):
-            return []
-        signals = []
+            return [], []
         text_lower = text.lower()
-        
-        for brand in OEM_BRANDS:
-            if brand in text_lower:
-                if brand not in signals:
-                    signals.append(brand)
-        
-        return signals
+        if _SIGNALS_AUTOMATON is None:
+            found = {term for term in _FINISHING_TERMS + _OEM_TERMS if term in text_lower}
+        else:
+            found = set()
+            for _, term in _SIGNALS_AUTOMATON.iter(text_lower):
+                found.add(term)
+                if len(found) == len(_SIGNALS_AUTOMATON):
+                    break  # every term seen; the rest of the text adds nothing
+        return (
+            [keyword for keyword in _FINISHING_TERMS if keyword in found],
+            [brand for brand in _OEM_TERMS if brand in found],
+        )
+    
+    def _extract_finishing_signals(self, text: str) -> List[str]:
+        """Extract finishing/stenter keywords from text."""
+        return self._extract_signals(text)[0]
+    
+    def _extract_oem_signals(self, text: str) -> List[str]:
+        """Extract OEM brand mentions from text."""
+        return self._extract_signals(text)[1]
     
     def _extract_emails(self, text: str) -> List[str]:
         """
         Extract email addresses from text.
         P0 Fix: Enhanced filtering with blocklist.
         """
-        if not isinstance(text, str):
+        if not isinstance(text, str) or "@" not in text:  # no address possible; skip the regex scan
             return []
         found = EMAIL_REGEX.findall(text)
         
         # Filter out common false positives
         filtered = []
+        seen = set()
         for email in found:
             email_lower = email.lower()
+            if email_lower in seen:
+                continue
+            seen.add(email_lower)
             
             # Skip images, js files, CSS, etc.
-            if any(ext in email_lower for ext in [".png", ".jpg", ".gif", ".css", ".js", ".svg", ".ico", ".woff"]):
+            if any(ext in email_lower for ext in _EMAIL_ASSET_EXTENSIONS):
                 continue
             
             # P0: Skip blocklisted domains
-            if any(domain in email_lower for domain in EMAIL_BLOCKLIST_DOMAINS):
+            if _EMAIL_BLOCKLIST_DOMAIN_RE.search(email_lower):
                 continue
             
             # P0: Skip blocklisted prefixes
             local_part = email_lower.split("@")[0]
-            if any(local_part.startswith(prefix) for prefix in EMAIL_BLOCKLIST_PREFIXES):
+            if local_part.startswith(_EMAIL_BLOCKLIST_PREFIXES):
                 continue
             
             # Skip generic/useless emails
@@ -415,29 +850,58 @@ class DeepValidator:
                 # These are still useful but lower priority - keep them
                 pass
             
-            if email_lower not in [e.lower() for e in filtered]:
-                filtered.append(email)
+            filtered.append(email)
         
         return filtered
     
-    def _extract_phones(self, text: str) -> List[str]:
+    def _phone_region(self, website: str) -> Optional[str]:
+        """
+        Region hint for phone parsing from the website's country-code TLD.
+        
+        Without a region only +-prefixed international numbers are found;
+        with one, national formats (0212 555 12 34) parse as well.
+        """
+        host = urlsplit(self._homepage_urls(website)[0]).hostname or ""
+        tld = host.rsplit(".", 1)[-1]
+        if len(tld) != 2 or tld in GENERIC_CCTLDS:
+            return None
+        region = "GB" if tld == "uk" else tld.upper()
+        return region if region in phonenumbers.SUPPORTED_REGIONS else None
+    
+    def _extract_phones(self, text: str, region: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
         """
         Extract phone numbers from text.
         P0 Fix: Use phonenumbers library for accurate extraction.
+        
+        region: ISO 3166 alpha-2 hint for national-format numbers (see _phone_region).
+        limit: stop scanning once this many distinct numbers are found.
         """
         if not isinstance(text, str):
             return []
+        # Without a region only +-prefixed (international) numbers can match
+        if region is None and "+" not in text and "\uff0b" not in text:
+            return []
+        if not _MIN_PHONE_DIGITS_RE.search(text):
+            return []
         phones = []
+        seen = set()
         
         # Try phonenumbers library first (much more accurate)
         try:
-            for match in phonenumbers.PhoneNumberMatcher(text, None):
+            # Bounded candidate count: long digit runs in page text can't stall the matcher
+            matcher = phonenumbers.PhoneNumberMatcher(
+                text, region, leniency=phonenumbers.Leniency.VALID, max_tries=500
+            )
+            for match in matcher:
                 phone_str = phonenumbers.format_number(
                     match.number, 
                     phonenumbers.PhoneNumberFormat.E164
                 )
-                if phone_str not in phones:
+                if phone_str not in seen:
+                    seen.add(phone_str)
                     phones.append(phone_str)
+                    if limit is not None and len(phones) >= limit:
+                        break
         except Exception as e:
             logger.debug(f"phonenumbers parsing error: {e}")
             # Fallback to regex if library fails
@@ -453,8 +917,11 @@ class DeepValidator:
                     if digits in ["10000000", "12345678", "00000000", "1234567890"]:
                         continue
                     cleaned = phone.strip()
-                    if cleaned not in phones:
+                    if cleaned not in seen:
+                        seen.add(cleaned)
                         phones.append(cleaned)
+                        if limit is not None and len(phones) >= limit:
+                            break
         
         return phones
     
@@ -487,23 +954,90 @@ class DeepValidator:
         return 3
     
     def _validate_lead_with_timeout(self, lead: Dict, timeout_seconds: int = 30) -> Dict:
-        """Validate lead with hard thread-based timeout."""
-        future = _executor.submit(self.validate_lead, lead)
+        """
+        Validate lead with hard thread-based timeout.
+        
+        Each lead gets its own daemon thread: a lead abandoned at the timeout
+        (still blocked on a socket) cannot hold a pool worker and make the
+        following leads queue into their own timeouts.
+        """
+        outcome = {}
+        
+        def run():
+            try:
+                outcome["lead"] = self.validate_lead(lead)
+            except Exception as e:
+                outcome["error"] = e
+        
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout_seconds)
+        if worker.is_alive():
+            return self._mark_hard_timeout(lead, timeout_seconds)
+        if "error" in outcome:
+            return self._mark_thread_error(lead, outcome["error"])
+        return outcome["lead"]
+    
+    async def _avalidate_lead_with_timeout(self, session, lead: Dict, timeout_seconds: int = 30) -> Dict:
+        """Async counterpart: the lead's coroutine is cancelled at the hard timeout."""
         try:
-            return future.result(timeout=timeout_seconds)
-        except FuturesTimeoutError:
-            logger.warning(f"HARD TIMEOUT: {lead.get('company', 'Unknown')[:30]} after {timeout_seconds}s")
-            lead["validation_status"] = "hard_timeout"
-            lead["fail_reason"] = f"hard_timeout_{timeout_seconds}s"
-            lead["tier"] = 3
-            lead["website_accessible"] = False
-            return lead
+            return await asyncio.wait_for(self._avalidate_lead(session, lead), timeout_seconds)
+        except asyncio.TimeoutError:
+            return self._mark_hard_timeout(lead, timeout_seconds)
         except Exception as e:
-            logger.warning(f"Thread error: {lead.get('company', 'Unknown')[:30]} - {e}")
-            lead["validation_status"] = "thread_error"
-            lead["fail_reason"] = str(e)[:100]
-            lead["tier"] = 3
-            return lead
+            return self._mark_thread_error(lead, e)
+    
+    @staticmethod
+    def _mark_hard_timeout(lead: Dict, timeout_seconds: int) -> Dict:
+        logger.warning(f"HARD TIMEOUT: {lead.get('company', 'Unknown')[:30]} after {timeout_seconds}s")
+        lead["validation_status"] = "hard_timeout"
+        lead["fail_reason"] = f"hard_timeout_{timeout_seconds}s"
+        lead["tier"] = 3
+        lead["website_accessible"] = False
+        return lead
+    
+    @staticmethod
+    def _mark_thread_error(lead: Dict, error: Exception) -> Dict:
+        logger.warning(f"Thread error: {lead.get('company', 'Unknown')[:30]} - {error}")
+        lead["validation_status"] = "thread_error"
+        lead["fail_reason"] = str(error)[:100]
+        lead["tier"] = 3
+        return lead
+    
+    def _use_async(self) -> bool:
+        """Batch validation goes async when aiohttp is available and no loop is running"""
+        if aiohttp is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    async def _avalidate_all(self, leads: List[Dict], hard_timeout: int, on_done) -> List[Dict]:
+        """
+        Validate leads concurrently over one pooled aiohttp session.
+        
+        Up to CONCURRENCY leads are in flight, and leads on the same host start
+        at least HOST_INTERVAL apart. on_done(lead, elapsed) is called as each
+        finishes.
+        Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        results: List[Optional[Dict]] = [None] * len(leads)
+        self._host_next = {}
+        
+        async def run(index: int, lead: Dict) -> None:
+            async with semaphore:
+                await self._ahost_wait(lead.get("website"))
+                lead_start = time.monotonic()
+                results[index] = await self._avalidate_lead_with_timeout(session, lead, hard_timeout)
+                on_done(results[index], time.monotonic() - lead_start)
+        
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=4, ssl=False)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(*(run(i, lead) for i, lead in enumerate(leads)))
+        return results
     
     def validate_batch(
         self,
@@ -512,16 +1046,22 @@ class DeepValidator:
         checkpoint_every: int = 25,
         checkpoint_dir: Optional[str] = None,
         hard_timeout: int = 30,
+        use_cache: Optional[bool] = None,
     ) -> List[Dict]:
         """
         Validate a batch of leads with checkpoint support and HARD timeout.
         
+        With aiohttp installed, leads are validated concurrently (CONCURRENCY
+        at a time); otherwise sequentially. Either way, leads on the same host
+        start at least HOST_INTERVAL apart.
+        
         Args:
             leads: List of leads to validate
             progress_callback: Optional callback for progress updates
             checkpoint_every: Save checkpoint every N leads (default 25)
             checkpoint_dir: Directory for checkpoint files
             hard_timeout: Hard timeout per lead in seconds (default 30)
+            use_cache: Override the page cache for this batch (False = fresh fetches)
         
         Returns list of validated leads.
         """
@@ -536,57 +1076,82 @@ class DeepValidator:
         os.makedirs(checkpoint_dir, exist_ok=True)
         checkpoint_file = os.path.join(checkpoint_dir, "validation_checkpoint.csv")
         
-        validated = []
+        validated = []  # completion order (checkpoints)
+        checkpoint_columns = []  # header of the checkpoint file
+        checkpointed = 0  # leads of `validated` already in the checkpoint file
         batch_start_time = time.monotonic()
         timeouts_count = 0
         
-        for i, lead in enumerate(leads):
-            lead_start = time.monotonic()
-            
-            # Use thread-based hard timeout
-            validated_lead = self._validate_lead_with_timeout(lead, timeout_seconds=hard_timeout)
-            
-            lead_elapsed = time.monotonic() - lead_start
+        def on_done(validated_lead: Dict, lead_elapsed: float) -> None:
+            nonlocal timeouts_count, checkpoint_columns, checkpointed
             validated_lead["validation_time_seconds"] = round(lead_elapsed, 2)
             
             if validated_lead.get("validation_status") == "hard_timeout":
                 timeouts_count += 1
             
             validated.append(validated_lead)
+            done = len(validated)
             
             # Progress logging - every 5 leads for better visibility
             if progress_callback:
-                progress_callback(i + 1, total_leads)
-            elif (i + 1) % 5 == 0 or (i + 1) == total_leads:
+                progress_callback(done, total_leads)
+            elif done % 5 == 0 or done == total_leads:
                 elapsed_total = time.monotonic() - batch_start_time
-                rate = (i + 1) / elapsed_total if elapsed_total > 0 else 0
-                eta = (total_leads - i - 1) / rate if rate > 0 else 0
-                logger.info(f"Validation: {i + 1}/{total_leads} | "
+                rate = done / elapsed_total if elapsed_total > 0 else 0
+                eta = (total_leads - done) / rate if rate > 0 else 0
+                logger.info(f"Validation: {done}/{total_leads} | "
                            f"Rate: {rate:.1f}/s | ETA: {eta/60:.1f}min | "
                            f"T1: {self.stats.get('tier_1', 0)} | TO: {timeouts_count}")
             
-            # Checkpoint save
-            if (i + 1) % checkpoint_every == 0:
+            # Checkpoint save: append the leads since the last one; the file is
+            # only rewritten for the first checkpoint or when new fields appear
+            if done % checkpoint_every == 0:
                 try:
-                    df_checkpoint = pd.DataFrame(validated)
-                    df_checkpoint.to_csv(checkpoint_file, index=False)
-                    logger.info(f"💾 Checkpoint saved: {i + 1} leads -> {checkpoint_file}")
+                    new_rows = validated[checkpointed:]
+                    known = set(checkpoint_columns)
+                    if checkpointed and all(known.issuperset(row) for row in new_rows):
+                        pd.DataFrame(new_rows, columns=checkpoint_columns).to_csv(
+                            checkpoint_file, index=False, mode="a", header=False
+                        )
+                    else:
+                        df_checkpoint = pd.DataFrame(validated)
+                        df_checkpoint.to_csv(checkpoint_file, index=False)
+                        checkpoint_columns = list(df_checkpoint.columns)
+                    checkpointed = done
+                    logger.info(f"💾 Checkpoint saved: {done} leads -> {checkpoint_file}")
                 except Exception as e:
                     logger.warning(f"Checkpoint save failed: {e}")
-            
-            # Polite delay (reduced from 0.5 to 0.3 for faster processing)
-            time.sleep(0.3)
+        
+        default_use_cache = self.use_cache
+        if use_cache is not None:
+            self.use_cache = use_cache
+        self._prune_cache()
+        try:
+            if self._use_async():
+                validated_in_order = asyncio.run(self._avalidate_all(leads, hard_timeout, on_done))
+            else:
+                self._host_next = {}
+                for lead in leads:
+                    self._host_wait(lead.get("website"))
+                    lead_start = time.monotonic()
+                    
+                    # Use thread-based hard timeout
+                    validated_lead = self._validate_lead_with_timeout(lead, timeout_seconds=hard_timeout)
+                    on_done(validated_lead, time.monotonic() - lead_start)
+                validated_in_order = validated
+        finally:
+            self.use_cache = default_use_cache
         
         # Final checkpoint
         try:
-            df_final = pd.DataFrame(validated)
+            df_final = pd.DataFrame(validated_in_order)
             df_final.to_csv(checkpoint_file, index=False)
-            logger.info(f"✅ Final checkpoint saved: {len(validated)} leads")
+            logger.info(f"✅ Final checkpoint saved: {len(validated_in_order)} leads")
         except Exception as e:
             logger.warning(f"Final checkpoint failed: {e}")
         
         logger.info(f"Deep validation complete. Stats: {self.stats}")
-        return validated
+        return validated_in_order
     
     def get_stats(self) -> Dict:
         """Return validation statistics."""
@@ -596,41 +1161,66 @@ class DeepValidator:
 class TierExporter:
     """Export validated leads by tier."""
     
+    KEY_COLUMNS = [
+        "company", "country", "website", "emails_extracted",
+        "phones_extracted", "finishing_signals", "oem_signals",
+        "tier", "validation_status",
+    ]
+    
     @staticmethod
     def export_by_tier(
         leads: List[Dict],
         output_dir: str,
         timestamp: Optional[str] = None,
+        file_format: str = "csv",
     ) -> Dict[int, str]:
         """
         Export leads separated by tier.
         
+        file_format: "csv" (default) or "parquet" (pyarrow, zstd; list
+        columns such as emails_extracted stay lists instead of repr strings).
+        
         Returns dict mapping tier -> filepath.
         """
         import pandas as pd
         
+        if file_format not in ("csv", "parquet"):
+            raise ValueError(f"Unsupported tier export format: {file_format}")
+        
         os.makedirs(output_dir, exist_ok=True)
         timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # One pass over the leads instead of one filter per tier
+        by_tier: Dict[int, List[Dict]] = {1: [], 2: [], 3: []}
+        for lead in leads:
+            tier_leads = by_tier.get(lead.get("tier"))
+            if tier_leads is not None:
+                tier_leads.append(lead)
+        
         tier_files = {}
         
         for tier in [1, 2, 3]:
-            tier_leads = [l for l in leads if l.get("tier") == tier]
+            tier_leads = by_tier[tier]
             if tier_leads:
-                df = pd.DataFrame(tier_leads)
+                # Select key columns (only those present) without building
+                # a frame of every validation field first
+                present = set().union(*tier_leads)
+                available_cols = [c for c in TierExporter.KEY_COLUMNS if c in present]
+                rows = [{c: lead.get(c) for c in available_cols} for lead in tier_leads]
                 
-                # Select key columns
-                key_cols = [
-                    "company", "country", "website", "emails_extracted",
-                    "phones_extracted", "finishing_signals", "oem_signals",
-                    "tier", "validation_status",
-                ]
-                available_cols = [c for c in key_cols if c in df.columns]
-                df = df[available_cols]
-                
-                filename = f"tier_{tier}_leads_{timestamp}.csv"
+                filename = f"tier_{tier}_leads_{timestamp}.{file_format}"
                 filepath = os.path.join(output_dir, filename)
-                df.to_csv(filepath, index=False)
+                if file_format == "parquet":
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    # pandas NaN (float) in text columns -> null, or Arrow can't infer a type
+                    rows = [
+                        {c: None if isinstance(v, float) and v != v else v for c, v in row.items()}
+                        for row in rows
+                    ]
+                    pq.write_table(pa.Table.from_pylist(rows), filepath, compression="zstd")
+                else:
+                    pd.DataFrame(rows, columns=available_cols).to_csv(filepath, index=False)
                 tier_files[tier] = filepath
                 
                 logger.info(f"Tier {tier}: Exported {len(tier_leads)} leads to {filepath}")
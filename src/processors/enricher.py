@@ -1,30 +1,49 @@
-from urllib.parse import urlparse
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from src.processors.entity_extractor import EntityExtractor
 from src.processors.website_discovery import WebsiteDiscovery
 from src.processors.contact_enricher import ContactEnricher
 from src.utils.logger import get_logger
+from src.utils.urls import split_url
 
 logger = get_logger(__name__)
 
 # GPT Fix #1: Free email domains to exclude from website inference
-FREE_EMAIL_DOMAINS = {
+FREE_EMAIL_DOMAINS = frozenset({
     'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'live.com',
     'aol.com', 'icloud.com', 'mail.com', 'protonmail.com', 'zoho.com',
     'yandex.com', 'gmx.com', 'gmx.de', 'web.de', 'mail.ru', 'qq.com',
     '163.com', '126.com', 'sina.com', 'msn.com', 'me.com', 'mac.com',
     'googlemail.com', 'pm.me', 'tutanota.com', 'fastmail.com'
-}
+})
 
 # GPT Fix #2: Social/marketplace domains to exclude from source_url -> website
-EXCLUDE_SOURCE_DOMAINS = {
+EXCLUDE_SOURCE_DOMAINS = frozenset({
     'linkedin.com', 'facebook.com', 'twitter.com', 'instagram.com',
     'youtube.com', 'tiktok.com', 'pinterest.com', 'reddit.com',
     'alibaba.com', 'aliexpress.com', 'amazon.com', 'ebay.com',
     'made-in-china.com', 'indiamart.com', 'thomasnet.com',
     'europages.com', 'kompass.com', 'dnb.com', 'zoominfo.com',
     'bloomberg.com', 'reuters.com', 'wikipedia.org', 'britannica.com'
-}
+})
+
+
+def _exclude_source_automaton():
+    """Automaton over EXCLUDE_SOURCE_DOMAINS (None without pyahocorasick)."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for excl in EXCLUDE_SOURCE_DOMAINS:
+        automaton.add_word(excl, excl)
+    automaton.make_automaton()
+    return automaton
+
+
+_EXCLUDE_SOURCE_AUTOMATON = _exclude_source_automaton()
 
 
 class Enricher:
@@ -34,6 +53,22 @@ class Enricher:
         self.sources = sources or {}
         self.policies = policies or {}
         self.extractor = EntityExtractor()
+        # Region labels flattened once; _match_countries runs for every lead
+        self._country_labels = [
+            (label, label.lower())
+            for data in self.targets.get("target_regions", {}).values()
+            for label in data.get("labels", [])
+        ]
+        # One-pass scanner over all labels (None -> substring loop)
+        self._country_automaton = None
+        if AHOCORASICK_AVAILABLE and self._country_labels:
+            self._country_automaton = ahocorasick.Automaton()
+            labels_by_key = {}
+            for label, label_l in self._country_labels:
+                labels_by_key.setdefault(label_l, []).append(label)
+            for label_l, labels in labels_by_key.items():
+                self._country_automaton.add_word(label_l, labels)
+            self._country_automaton.make_automaton()
         enrichment_cfg = self.settings.get("enrichment", {})
         website_cfg = enrichment_cfg.get("website_discovery", {})
         contact_cfg = enrichment_cfg.get("contact", {})
@@ -68,9 +103,8 @@ class Enricher:
         if context is None or (isinstance(context, float) and str(context) == "nan"):
             context = ""
         context = str(context) if context else ""
-        lead["emails"] = self.extractor.extract_emails(context)
-        lead["phones"] = self.extractor.extract_phones(context)
-        websites = set(self.extractor.extract_websites(context))
+        lead["emails"], lead["phones"], websites = self.extractor.extract_contacts(context)
+        websites = set(websites)
         if lead.get("website") and str(lead.get("website")).lower() not in {"nan", "none", "null"}:
             websites.add(str(lead["website"]))
         websites = {str(site) for site in websites if site and str(site) != "nan"}
@@ -146,17 +180,21 @@ class Enricher:
         
         # Extract domain from source_url
         try:
-            parsed = urlparse(source_url)
-            domain = parsed.netloc.lower()
+            scheme, netloc = split_url(source_url)
+            domain = netloc.lower()
             # Remove www. prefix for comparison
             domain_clean = domain.replace("www.", "")
             
             # Check if it's a social/marketplace domain
-            if any(excl in domain_clean for excl in EXCLUDE_SOURCE_DOMAINS):
+            if _EXCLUDE_SOURCE_AUTOMATON is None:
+                excluded = any(excl in domain_clean for excl in EXCLUDE_SOURCE_DOMAINS)
+            else:
+                excluded = next(_EXCLUDE_SOURCE_AUTOMATON.iter(domain_clean), None) is not None
+            if excluded:
                 return lead
             
             # Valid source - use as website
-            base_url = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme else f"https://{parsed.netloc}"
+            base_url = f"{scheme}://{netloc}" if scheme else f"https://{netloc}"
             lead["website"] = base_url
             lead["website_source"] = "source_url_transfer"
             logger.debug(f"Transferred source_url to website: {base_url}")
@@ -170,14 +208,14 @@ class Enricher:
             return ""
         if str(url).lower() in {"nan", "none", ""}:
             return ""
-        parsed = urlparse(str(url))
-        return parsed.netloc.lower()
+        return split_url(str(url))[1].lower()
 
     def _match_countries(self, text):
-        text_l = (text or "").lower()
-        hits = []
-        for _, data in self.targets.get("target_regions", {}).items():
-            for label in data.get("labels", []):
-                if label.lower() in text_l:
-                    hits.append(label)
-        return sorted(set(hits))
+        if not text or not self._country_labels:
+            return []
+        text_l = text.lower()
+        if self._country_automaton is None:
+            hits = {label for label, label_l in self._country_labels if label_l in text_l}
+        else:
+            hits = {label for _, labels in self._country_automaton.iter(text_l) for label in labels}
+        return sorted(hits)
@@ -11,19 +11,26 @@ Lead'de website yoksa veya yanlış domain varsa:
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from src.processors.website_discovery import WebsiteDiscovery
 from src.processors.contact_enricher import ContactEnricher
 from src.utils.http_client import HttpClient
 from src.utils.logger import get_logger
+from src.utils.urls import split_url
 
 logger = get_logger(__name__)
 
 
 # Non-company domains that indicate lead needs enrichment
-NON_COMPANY_DOMAINS = {
+NON_COMPANY_DOMAINS = frozenset({
     # Certification/registry sites
     'global-standard.org', 'global-trace-base.org', 'oeko-tex.com', 
     'bluesign.com', 'bettercotton.org', 'textileexchange.org',
@@ -39,7 +46,34 @@ NON_COMPANY_DOMAINS = {
     # Marketplaces
     'alibaba.com', 'aliexpress.com', 'made-in-china.com', 'indiamart.com',
     'thomasnet.com', 'europages.com', 'kompass.com',
-}
+})
+
+
+def _non_company_automaton():
+    """Automaton over NON_COMPANY_DOMAINS (None without pyahocorasick)."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for non_company in NON_COMPANY_DOMAINS:
+        automaton.add_word(non_company, non_company)
+    automaton.make_automaton()
+    return automaton
+
+
+_NON_COMPANY_AUTOMATON = _non_company_automaton()
+
+
+@lru_cache(maxsize=50_000)
+def _canonical_domain(website: str) -> str:
+    """Lowercased netloc without www., memoized: a lead's website is checked several times."""
+    return split_url(website)[1].lower().replace("www.", "")
+
+
+def _is_non_company_domain(domain: str) -> bool:
+    """True if any NON_COMPANY_DOMAINS entry occurs in domain (one scan)."""
+    if _NON_COMPANY_AUTOMATON is None:
+        return any(non_company in domain for non_company in NON_COMPANY_DOMAINS)
+    return next(_NON_COMPANY_AUTOMATON.iter(domain), None) is not None
 
 
 class EnrichmentQueue:
@@ -154,13 +188,11 @@ class EnrichmentQueue:
         
         # Check if domain is non-company
         try:
-            parsed = urlparse(str(website))
-            domain = parsed.netloc.lower().replace("www.", "")
+            domain = _canonical_domain(str(website))
             
             # Check against non-company domains
-            for non_company in NON_COMPANY_DOMAINS:
-                if non_company in domain:
-                    return True, f"non_company_domain:{domain}"
+            if _is_non_company_domain(domain):
+                return True, f"non_company_domain:{domain}"
         except:
             return True, "invalid_url"
         
@@ -177,14 +209,9 @@ class EnrichmentQueue:
             return False
         
         try:
-            parsed = urlparse(str(website))
-            domain = parsed.netloc.lower().replace("www.", "")
-            
-            for non_company in NON_COMPANY_DOMAINS:
-                if non_company in domain:
-                    return False
+            domain = _canonical_domain(str(website))
             
-            return True
+            return not _is_non_company_domain(domain)
         except:
             return False
     
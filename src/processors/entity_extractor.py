@@ -1,9 +1,20 @@
 import re
+from functools import lru_cache
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled once at import; extraction and normalization run for every lead
+_EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
+_PHONE_RE = re.compile(r"\+?\d[\d\s\-()]{6,}\d")
+_URL_RE = re.compile(r"(https?://[^\s)\]\"'>]+)", re.IGNORECASE)
+_WWW_RE = re.compile(r"\bwww\.[^\s)\]\"'>]+", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[\"'.,()]")
+_CAPITALIZED_PHRASE_RE = re.compile(r"\b([A-Z][A-Za-z0-9&\-.]+(?:\s+[A-Z][A-Za-z0-9&\-.]+){1,5})\b")
+_LEADING_NOISE_RE = re.compile(r"^[,\.\s&]+")
+
 
 class EntityExtractor:
     def __init__(self):
@@ -118,6 +129,11 @@ class EntityExtractor:
         self.trigger_regex = re.compile(
             r"\b(?:bei|für|for|at|with|cliente|client|customer)\s+([A-Z][A-Za-z0-9&\-.]+(?:\s+[A-Z][A-Za-z0-9&\-.]+){0,3})"
         )
+        # Suffixes are whole words that never overlap, so one pass removes the
+        # same words as stripping them one suffix at a time
+        self.suffix_strip_regex = re.compile(rf"\b(?:{suffix_pattern})\b")
+        # The same names are normalized by enrichment, dedupe and discovery
+        self.normalize_company = lru_cache(maxsize=65536)(self.normalize_company)
 
     def extract_companies(self, text, strict=False):
         if not text:
@@ -148,28 +164,35 @@ class EntityExtractor:
 
         return sorted(companies)
 
+    def extract_contacts(self, text):
+        """
+        Emails, phones and websites of one text: the same lists as the three
+        extract_* methods, with the text coerced and lowercased only once.
+        """
+        if not text or (isinstance(text, float)):
+            return [], [], []
+        text = str(text)
+        lowered = text.lower()
+        return (
+            self._extract_emails(text, lowered),
+            self.extract_phones(text),
+            self._extract_websites(text, lowered),
+        )
+
     def extract_emails(self, text):
         if not text or (isinstance(text, float)):
             return []
         text = str(text)
-        emails = set(
-            re.findall(
-                r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}",
-                text,
-                flags=re.IGNORECASE,
-            )
-        )
+        return self._extract_emails(text, text.lower())
+
+    def _extract_emails(self, text, lowered):
         # Handle common obfuscations like "name (at) domain (dot) com"
-        normalized = text.lower()
-        normalized = normalized.replace("[at]", "@").replace("(at)", "@").replace(" at ", "@")
+        normalized = lowered.replace("[at]", "@").replace("(at)", "@").replace(" at ", "@")
+        if "@" not in normalized:  # no address, plain or obfuscated
+            return []
         normalized = normalized.replace("[dot]", ".").replace("(dot)", ".").replace(" dot ", ".")
-        emails.update(
-            re.findall(
-                r"[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}",
-                normalized,
-                flags=re.IGNORECASE,
-            )
-        )
+        emails = set(_EMAIL_RE.findall(text))
+        emails.update(_EMAIL_RE.findall(normalized))
         return sorted(emails)
 
     def extract_phones(self, text):
@@ -177,8 +200,8 @@ class EntityExtractor:
             return []
         text = str(text)
         phones = set()
-        for match in re.findall(r"\+?\d[\d\s\-()]{6,}\d", text):
-            cleaned = re.sub(r"\s+", " ", match).strip()
+        for match in _PHONE_RE.findall(text):
+            cleaned = _WS_RE.sub(" ", match).strip()
             if len(cleaned) >= 7:
                 phones.add(cleaned)
         return sorted(phones)
@@ -187,10 +210,15 @@ class EntityExtractor:
         if not text or (isinstance(text, float)):
             return []
         text = str(text)
+        return self._extract_websites(text, text.lower())
+
+    def _extract_websites(self, text, lowered):
+        if "://" not in text and "www." not in lowered:
+            return []
         urls = set()
-        for match in re.findall(r"(https?://[^\s)\]\"'>]+)", text, flags=re.IGNORECASE):
+        for match in _URL_RE.findall(text):
             urls.add(match.rstrip(".,;"))
-        for match in re.findall(r"\bwww\.[^\s)\]\"'>]+", text, flags=re.IGNORECASE):
+        for match in _WWW_RE.findall(text):
             urls.add(f"http://{match.rstrip('.,;')}")
         return sorted(urls)
 
@@ -198,11 +226,10 @@ class EntityExtractor:
         if not name or (isinstance(name, float)):
             return ""
         name = str(name)
-        cleaned = re.sub(r"[\"'.,()]", " ", name)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip().lower()
-        for suffix in self.company_suffixes:
-            cleaned = re.sub(rf"\b{re.escape(suffix)}\b", "", cleaned).strip()
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _PUNCT_RE.sub(" ", name)
+        cleaned = _WS_RE.sub(" ", cleaned).strip().lower()
+        cleaned = self.suffix_strip_regex.sub("", cleaned)
+        cleaned = _WS_RE.sub(" ", cleaned).strip()
         return cleaned
 
     def _extract_with_suffix(self, line):
@@ -235,10 +262,7 @@ class EntityExtractor:
         return companies
 
     def _extract_capitalized_phrase(self, line):
-        match = re.search(
-            r"\b([A-Z][A-Za-z0-9&\-.]+(?:\s+[A-Z][A-Za-z0-9&\-.]+){1,5})\b",
-            line,
-        )
+        match = _CAPITALIZED_PHRASE_RE.search(line)
         return self._clean_name(match.group(1)) if match else ""
 
     def _is_valid_company(self, candidate, allow_single=False):
@@ -265,6 +289,6 @@ class EntityExtractor:
 
     def _clean_name(self, name):
         cleaned = " ".join(name.split()).strip()
-        cleaned = re.sub(r"^[,\.\s&]+", "", cleaned)
+        cleaned = _LEADING_NOISE_RE.sub("", cleaned)
         cleaned = cleaned.strip("-")
         return cleaned
@@ -1,21 +1,26 @@
 import csv
 import os
 
+FIELDNAMES = [
+    "source_type",
+    "source_name",
+    "url",
+    "title",
+    "snippet",
+    "content_hash",
+    "fetched_at",
+]
+
 
 def record_evidence(path, payload):
+    record_evidence_batch(path, [payload])
+
+
+def record_evidence_batch(path, payloads):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     exists = os.path.exists(path)
-    fieldnames = [
-        "source_type",
-        "source_name",
-        "url",
-        "title",
-        "snippet",
-        "content_hash",
-        "fetched_at",
-    ]
     with open(path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
         if not exists:
             writer.writeheader()
-        writer.writerow({k: payload.get(k, "") for k in fieldnames})
+        writer.writerows({k: payload.get(k, "") for k in FIELDNAMES} for payload in payloads)
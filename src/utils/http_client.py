@@ -1,6 +1,7 @@
 import csv
 import hashlib
 import os
+import threading
 import time
 from datetime import datetime
 from urllib.parse import urlparse
@@ -37,18 +38,29 @@ class HttpClient:
         self.domain_last_request = {}
         self.robots_cache = {}
         self.session = requests.Session()
+        # Callers may share one client across threads (e.g. ContactEnricher)
+        self._rate_lock = threading.Lock()
+        self._log_lock = threading.Lock()
 
         self.url_log_path = os.path.join(cache_dir, "url_log.csv")
 
     def _rate_limit(self, domain):
         if self.min_delay <= 0:
             return
-        last = self.domain_last_request.get(domain)
-        if last is None:
-            return
-        elapsed = time.time() - last
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
+        # Reserve the next slot for this domain under the lock, sleep outside it
+        with self._rate_lock:
+            last = self.domain_last_request.get(domain)
+            now = time.time()
+            slot = now if last is None else max(now, last + self.min_delay)
+            self.domain_last_request[domain] = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _mark_request(self, domain):
+        with self._rate_lock:
+            self.domain_last_request[domain] = max(
+                time.time(), self.domain_last_request.get(domain, 0)
+            )
 
     def _url_hash(self, url):
         return hashlib.sha256(url.encode("utf-8")).hexdigest()
@@ -58,6 +70,10 @@ class HttpClient:
 
     def _log_fetch(self, url, status, from_cache, content_hash=None):
         os.makedirs(self.cache_dir, exist_ok=True)
+        with self._log_lock:
+            self._append_log_row(url, status, from_cache, content_hash)
+
+    def _append_log_row(self, url, status, from_cache, content_hash):
         exists = os.path.exists(self.url_log_path)
         with open(self.url_log_path, "a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(
@@ -142,7 +158,7 @@ class HttpClient:
                     self._log_fetch(url, response.status_code, False, self._url_hash(url))
                     return None
                 html = response.text
-                self.domain_last_request[domain] = time.time()
+                self._mark_request(domain)
                 if self.cache_raw_html:
                     with open(cache_path, "w", encoding="utf-8", errors="ignore") as f:
                         f.write(html)
@@ -170,7 +186,7 @@ class HttpClient:
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
             with open(dest_path, "wb") as f:
                 f.write(response.content)
-            self.domain_last_request[domain] = time.time()
+            self._mark_request(domain)
             self._log_fetch(url, response.status_code, False, self._url_hash(url))
             return True
         except Exception as e:
@@ -0,0 +1,16 @@
+import re
+from urllib.parse import urlparse
+
+# Plain http(s) URLs: printable ASCII netloc ending at a path/query/fragment
+# delimiter or the end; anything else (spaces, brackets, other schemes,
+# non-ASCII hosts) is left to urlparse
+_HTTP_URL_RE = re.compile(r"(https?)://([^/?#\[\]\x00-\x20\x7f-\U0010ffff]*)(?=[/?#]|\Z)", re.IGNORECASE)
+
+
+def split_url(url):
+    """Return (scheme, netloc) of url, exactly as urlparse reports them."""
+    match = _HTTP_URL_RE.match(url)
+    if match:
+        return match.group(1).lower(), match.group(2)
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc